@@ -0,0 +1,85 @@
+"""
+Shared Document State for Legal Case Analysis
+
+Holds the per-text processing results that several tools need (spaCy doc,
+InLegalBERT CLS embedding) so that the same case text is only processed
+once when it flows through the whole pipeline, and the normalized form of
+mapped legal sections shared by the analysis prompt and the reports.
+"""
+
+import hashlib
+import threading
+import weakref
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+
+
+@dataclass
+class LegalDoc:
+    """Case text with lazily filled processing results."""
+
+    text: str
+    spacy_doc: Optional[Any] = None
+    cls_embedding: Optional[np.ndarray] = None
+
+
+# Live LegalDocs keyed by text hash; entries vanish once no caller holds them
+_legal_docs: "weakref.WeakValueDictionary[str, LegalDoc]" = weakref.WeakValueDictionary()
+_legal_docs_lock = threading.Lock()
+
+
+def get_legal_doc(text: str) -> LegalDoc:
+    """
+    Get the shared LegalDoc for a text, creating it if needed.
+
+    Args:
+        text: Case text
+
+    Returns:
+        LegalDoc memoized by the blake2b hash of the text
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    with _legal_docs_lock:
+        legal_doc = _legal_docs.get(key)
+        if legal_doc is None or legal_doc.text != text:
+            legal_doc = LegalDoc(text=text)
+            _legal_docs[key] = legal_doc
+
+    return legal_doc
+
+
+# Mapped legal section with display defaults applied, read by attribute
+NormalizedSection = namedtuple(
+    "NormalizedSection",
+    "act section title description punishment bailable cognizable"
+)
+
+
+def normalize_sections(
+    sections: Sequence[Union[Dict[str, Any], NormalizedSection]]
+) -> List[NormalizedSection]:
+    """
+    Convert section dicts to NormalizedSection tuples in a single pass.
+    
+    Args:
+        sections: Section dicts from the section mapper (already normalized
+            entries are passed through)
+        
+    Returns:
+        List of NormalizedSection
+    """
+    return [
+        s if isinstance(s, NormalizedSection) else NormalizedSection(
+            s.get("act", "Unknown"),
+            s.get("section", "N/A"),
+            s.get("title", ""),
+            s.get("description", ""),
+            s.get("punishment", ""),
+            s.get("bailable"),
+            s.get("cognizable")
+        )
+        for s in sections
+    ]
@@ -11,7 +11,7 @@ import uuid
 import time
 from contextvars import ContextVar
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
@@ -20,7 +20,7 @@ from model_loader import model_loader
 from document_processor import document_processor
 from text_preprocessor import text_preprocessor
 from tools.issue_classifier_tool import issue_classifier
-from tools.section_mapper_tool import section_mapper
+from tools.section_mapper_tool import get_section_mapper
 from tools.evidence_extractor_tool import evidence_extractor
 from tools.legal_analyzer_tool import legal_analyzer
 from tools.report_generator_tool import report_generator
@@ -117,6 +117,13 @@ class MapSectionsRequest(BaseModel):
     secondary_issues: Optional[List[str]] = None
 
 
+class SearchSectionsRequest(BaseModel):
+    """Request model for section search."""
+    query: str
+    any_keyword: bool = False
+    smart_case: bool = False
+
+
 class ExtractEvidenceRequest(BaseModel):
     """Request model for evidence extraction."""
     text: str
@@ -468,7 +475,7 @@ async def classify_issues(request: ClassifyRequest) -> Dict[str, Any]:
 
 # Section mapping endpoint
 @app.post("/map-sections")
-async def map_sections(request: MapSectionsRequest) -> Dict[str, Any]:
+async def map_sections(request: MapSectionsRequest) -> Response:
     """
     Map legal issues to relevant sections.
     
@@ -482,15 +489,38 @@ async def map_sections(request: MapSectionsRequest) -> Dict[str, Any]:
         request: MapSectionsRequest with domain and issues
         
     Returns:
-        Dict with mapped sections from relevant acts
+        JSON with mapped sections from relevant acts
     """
-    result = section_mapper.map_sections(
+    # Section JSON is pre-serialized by the mapper, so skip re-encoding
+    content = get_section_mapper().map_sections_bytes(
         domain=request.domain,
         primary_issue=request.primary_issue,
         secondary_issues=request.secondary_issues
     )
     
-    return result
+    return Response(content=content, media_type="application/json")
+
+
+# Section search endpoint
+@app.post("/search-sections")
+async def search_sections(request: SearchSectionsRequest) -> Dict[str, Any]:
+    """
+    Search legal sections by title, description or section number.
+    
+    Args:
+        request: SearchSectionsRequest with the query; any_keyword matches
+            sections containing any of its words instead of the whole query
+        
+    Returns:
+        JSON with the matching sections
+    """
+    mapper = get_section_mapper()
+    if request.any_keyword:
+        results = mapper.search_keywords(request.query.split())
+    else:
+        results = mapper.search_sections(request.query, smart_case=request.smart_case)
+    
+    return {"query": request.query, "count": len(results), "sections": results}
 
 
 # Evidence extraction endpoint
@@ -536,7 +566,7 @@ async def legal_analysis(request: LegalAnalysisRequest) -> Dict[str, Any]:
     Returns:
         Dict with legal analysis and reasoning
     """
-    result = legal_analyzer.analyze_case(
+    result = await legal_analyzer.analyze_case_async(
         facts=request.facts,
         sections=request.sections,
         domain=request.domain,
@@ -546,6 +576,32 @@ async def legal_analysis(request: LegalAnalysisRequest) -> Dict[str, Any]:
     return result
 
 
+@app.post("/legal-analysis/stream")
+async def legal_analysis_stream(request: LegalAnalysisRequest) -> StreamingResponse:
+    """
+    Stream the legal analysis as it is generated.
+    
+    Same analysis as /legal-analysis, but the markdown text is sent chunk by
+    chunk while Gemini is still generating, so the first paragraphs reach
+    the client without waiting for the full response.
+    
+    Args:
+        request: LegalAnalysisRequest with facts, sections, domain, and evidence
+        
+    Returns:
+        Streaming markdown response
+    """
+    return StreamingResponse(
+        legal_analyzer.stream_analysis_async(
+            facts=request.facts,
+            sections=request.sections,
+            domain=request.domain,
+            evidence=request.evidence
+        ),
+        media_type="text/markdown; charset=utf-8"
+    )
+
+
 # Report generation endpoint
 @app.post("/generate-report")
 async def generate_report(request: GenerateReportRequest) -> Dict[str, Any]:
@@ -568,7 +624,7 @@ async def generate_report(request: GenerateReportRequest) -> Dict[str, Any]:
     Returns:
         Dict with report paths and metadata
     """
-    result = report_generator.generate_report(
+    result = await report_generator.generate_report_async(
         case_id=request.case_id,
         case_data=request.case_data,
         save_markdown=request.save_markdown
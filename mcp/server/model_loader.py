@@ -6,8 +6,10 @@ Models are stored locally in ./models/ directory for offline usage.
 """
 
 import os
+import inspect
 from pathlib import Path
 from typing import List, Dict, Optional
+import torch
 from transformers import AutoTokenizer, AutoModel
 import logging
 
@@ -28,6 +30,17 @@ LEGAL_MODELS = [
 ]
 
 
+class _LastHiddenState(torch.nn.Module):
+    """Wraps a model so ONNX export calls it with keyword inputs and gets a tensor back."""
+    
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+    
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+
 class ModelLoader:
     """Handles downloading and loading legal AI models."""
     
@@ -202,6 +215,65 @@ class ModelLoader:
         except Exception as e:
             logger.error(f"Error loading {model_name}: {str(e)}")
             return None, None
+    
+    def export_quantized_onnx(self, model_name: str, tokenizer, model) -> Optional[Path]:
+        """
+        Export a loaded model to ONNX with int8 dynamically quantized weights.
+        
+        The quantized graph is cached next to the downloaded model, so the
+        export only runs on the first load.
+        
+        Args:
+            model_name: HuggingFace model identifier
+            tokenizer: Tokenizer returned by load_model
+            model: Model returned by load_model
+            
+        Returns:
+            Path to the quantized ONNX file or None if export failed
+        """
+        onnx_dir = self.get_model_path(model_name) / "onnx"
+        quantized_path = onnx_dir / "model-int8.onnx"
+        
+        if quantized_path.exists():
+            return quantized_path
+        
+        try:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            
+            onnx_dir.mkdir(parents=True, exist_ok=True)
+            fp32_path = onnx_dir / "model.onnx"
+            
+            logger.info(f"Exporting {model_name} to ONNX...")
+            dummy = tokenizer("export", return_tensors="pt")
+            wrapper = _LastHiddenState(model).eval()
+            # Newer torch defaults to the dynamo exporter, which needs onnxscript
+            export_options = {"dynamo": False} if "dynamo" in inspect.signature(torch.onnx.export).parameters else {}
+            with torch.no_grad():
+                torch.onnx.export(
+                    wrapper,
+                    (dummy["input_ids"], dummy["attention_mask"]),
+                    str(fp32_path),
+                    input_names=["input_ids", "attention_mask"],
+                    output_names=["last_hidden_state"],
+                    dynamic_axes={
+                        "input_ids": {0: "batch", 1: "sequence"},
+                        "attention_mask": {0: "batch", 1: "sequence"},
+                        "last_hidden_state": {0: "batch", 1: "sequence"}
+                    },
+                    opset_version=14,
+                    **export_options
+                )
+            
+            logger.info(f"Quantizing {model_name} weights to int8...")
+            quantize_dynamic(str(fp32_path), str(quantized_path), weight_type=QuantType.QInt8)
+            fp32_path.unlink()
+            
+            logger.info(f"Quantized ONNX model saved to {quantized_path}")
+            return quantized_path
+            
+        except Exception as e:
+            logger.error(f"Error exporting {model_name} to ONNX: {str(e)}")
+            return None
 
 
 # Global instance
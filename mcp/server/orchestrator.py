@@ -13,8 +13,9 @@ from fastapi import UploadFile
 # Import all tools
 from document_processor import document_processor
 from text_preprocessor import text_preprocessor
+from legal_doc import LegalDoc, get_legal_doc
 from tools.issue_classifier_tool import issue_classifier
-from tools.section_mapper_tool import section_mapper
+from tools.section_mapper_tool import get_section_mapper
 from tools.evidence_extractor_tool import evidence_extractor
 from tools.legal_analyzer_tool import legal_analyzer
 from tools.report_generator_tool import report_generator
@@ -90,9 +91,13 @@ class CaseOrchestrator:
             pipeline_result["steps"]["preprocess"] = preprocess_result
             cleaned_text = preprocess_result.get("cleaned_text", all_text)
             
+            # Shared by the classifier and evidence extractor so the text
+            # is only run through each model once
+            legal_doc = get_legal_doc(cleaned_text)
+            
             # STEP 3: Classify Issues
             logger.info("STEP 3/7: Classifying legal issues...")
-            classification_result = self._step_classify(cleaned_text, use_embeddings)
+            classification_result = self._step_classify(legal_doc, use_embeddings)
             pipeline_result["steps"]["classification"] = classification_result
             
             # STEP 4: Map Sections
@@ -102,12 +107,12 @@ class CaseOrchestrator:
             
             # STEP 5: Extract Evidence
             logger.info("STEP 5/7: Extracting evidence...")
-            evidence_result = self._step_extract_evidence(cleaned_text)
+            evidence_result = self._step_extract_evidence(legal_doc)
             pipeline_result["steps"]["evidence"] = evidence_result
             
             # STEP 6: Legal Analysis
             logger.info("STEP 6/7: Generating legal analysis...")
-            analysis_result = self._step_analyze(
+            analysis_result = await self._step_analyze(
                 cleaned_text,
                 sections_result["all_sections"],
                 classification_result["domain"],
@@ -118,7 +123,7 @@ class CaseOrchestrator:
             # STEP 7: Generate Report
             logger.info("STEP 7/7: Generating PDF report...")
             case_id = pipeline_result["case_title"].replace(" ", "_")
-            report_result = self._step_generate_report(
+            report_result = await self._step_generate_report(
                 case_id,
                 cleaned_text,
                 classification_result,
@@ -217,23 +222,23 @@ class CaseOrchestrator:
         """Step 2: Preprocess text."""
         return text_preprocessor.preprocess(text, translate, clean)
     
-    def _step_classify(self, text: str, use_embeddings: bool) -> Dict[str, Any]:
+    def _step_classify(self, legal_doc: LegalDoc, use_embeddings: bool) -> Dict[str, Any]:
         """Step 3: Classify legal issues."""
-        return issue_classifier.classify_text(text, use_embeddings)
+        return issue_classifier.classify(legal_doc, use_embeddings)
     
     def _step_map_sections(self, classification: Dict[str, Any]) -> Dict[str, Any]:
         """Step 4: Map legal sections."""
-        return section_mapper.map_sections(
+        return get_section_mapper().map_sections(
             domain=classification["domain"],
             primary_issue=classification["primary_issue"],
             secondary_issues=classification.get("secondary_issues")
         )
     
-    def _step_extract_evidence(self, text: str) -> Dict[str, Any]:
+    def _step_extract_evidence(self, legal_doc: LegalDoc) -> Dict[str, Any]:
         """Step 5: Extract evidence."""
-        return evidence_extractor.extract_evidence(text)
+        return evidence_extractor.extract_evidence(legal_doc)
     
-    def _step_analyze(
+    async def _step_analyze(
         self,
         facts: str,
         sections: List[Dict[str, Any]],
@@ -241,9 +246,9 @@ class CaseOrchestrator:
         evidence: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Step 6: Generate legal analysis."""
-        return legal_analyzer.analyze_case(facts, sections, domain, evidence)
+        return await legal_analyzer.analyze_case_async(facts, sections, domain, evidence)
     
-    def _step_generate_report(
+    async def _step_generate_report(
         self,
         case_id: str,
         facts: str,
@@ -263,7 +268,7 @@ class CaseOrchestrator:
             "analysis": analysis
         }
         
-        return report_generator.generate_report(case_id, case_data, save_markdown=True)
+        return await report_generator.generate_report_async(case_id, case_data, save_markdown=True)
 
 
 # Global instance
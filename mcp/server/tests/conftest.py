@@ -0,0 +1,8 @@
+"""Make the server modules importable when pytest runs from any directory."""
+
+import sys
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+if str(SERVER_DIR) not in sys.path:
+    sys.path.insert(0, str(SERVER_DIR))
@@ -0,0 +1,165 @@
+"""Tests for evidence extraction against the original per-keyword logic."""
+
+import re
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from tools.evidence_extractor_tool import EvidenceExtractor
+
+
+# Entities recognized by the test pipeline; a blank model with an entity
+# ruler keeps the tests independent of downloaded spaCy models
+ENTITY_PATTERNS = [
+    {"label": "PERSON", "pattern": name}
+    for name in ("Ramesh", "Priya Kumar", "Suresh", "Anita Rao", "Vikram", "Meena")
+] + [
+    {"label": "GPE", "pattern": "Bangalore"},
+    {"label": "GPE", "pattern": "Delhi"},
+    {"label": "FAC", "pattern": "MG Road"},
+    {"label": "LOC", "pattern": "Cubbon Park"},
+    {"label": "DATE", "pattern": "25th January 2024"},
+    {"label": "DATE", "pattern": "yesterday"},
+    {"label": "MONEY", "pattern": "50,000 rupees"},
+]
+
+TEXTS = [
+    "Witness Ramesh saw the incident on 25th January 2024 at MG Road, Bangalore. "
+    "The accused stole Rs. 50,000 from the victim. CCTV footage is available as evidence. "
+    "Another witness, Priya Kumar, testified that she saw the accused near the crime scene.",
+    "Suresh met Anita Rao in Delhi yesterday. No one else was present.",
+    "The complainant Vikram stated that the informant, Meena, had deposed before the court "
+    "on 12/03/2023. Invoice no. INV-2023/44 and receipt number R-9 were filed, along with "
+    "an email dated 01-02-2023 and WhatsApp chat logs. He paid INR 1,20,000 and ₹ 500.50.",
+    "Meena declared that Ramesh had affirmed the agreement. The deed and the contracts, "
+    "photos, videos and a recording were shown. Exhibit no. A-1 was marked. "
+    "She observed Vikram near Cubbon Park. Suresh confirmed it.",
+    "Ramesh" + " filler" * 20 + " witnesses " + " filler" * 20 + " Suresh",
+    "",
+]
+
+# Patterns as they were before being precompiled and prefix-factored
+BASELINE_DOCUMENT_PATTERNS = [
+    r'(?:document|evidence|exhibit)\s+(?:no\.?|number)?\s*([A-Z0-9\-/]+)',
+    r'(?:receipt|invoice|bill)\s+(?:no\.?|number)?\s*([A-Z0-9\-/]+)',
+    r'(?:email|letter)\s+dated\s+([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})',
+    r'(CCTV\s+footage|video\s+recording|photograph)',
+    r'(WhatsApp\s+chat|SMS|text\s+message)',
+]
+BASELINE_DATE_PATTERNS = [
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
+    r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',
+    r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b',
+]
+BASELINE_MONEY_PATTERNS = [
+    r'Rs\.?\s*\d+(?:,\d+)*(?:\.\d+)?',
+    r'INR\s*\d+(?:,\d+)*(?:\.\d+)?',
+    r'₹\s*\d+(?:,\d+)*(?:\.\d+)?',
+]
+
+# Month-like and non-month words around dates
+DATE_TEXT = (
+    "On January 5, 2024 and jan 6 2024, JUL 4 1999, Sept 9, 2020, Mayday 3 2021, "
+    "Marching 3, 2020, Junk 12, 2020, Augustine 5, 2019, Jam 1, 2020, Octopus 8 2018, "
+    "Ma 2, 2020, December 31 1999, dated 2023/11/05 and 5-6-21; Febr 2 2022."
+)
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns(ENTITY_PATTERNS)
+    extractor = EvidenceExtractor()
+    extractor.nlp = nlp
+    return extractor
+
+
+def baseline_witnesses(text, doc):
+    """Witness detection as it was: the first keyword, in list order, in the context."""
+    witnesses = []
+    for ent in doc.ents:
+        if ent.label_ == "PERSON":
+            start_idx = max(0, ent.start_char - 50)
+            end_idx = min(len(text), ent.end_char + 50)
+            context = text[start_idx:end_idx].strip()
+            witness_type = next(
+                (k for k in EvidenceExtractor.WITNESS_KEYWORDS if k in context.lower()), "person"
+            )
+            witnesses.append({
+                "name": ent.text,
+                "type": witness_type,
+                "is_witness": witness_type != "person",
+                "context": context,
+                "position": {"start": ent.start_char, "end": ent.end_char}
+            })
+    return witnesses
+
+
+def spans(patterns, text):
+    return [[(m.span(), m.group(0)) for m in p.finditer(text)] for p in patterns]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_witnesses_match_baseline(extractor, text):
+    doc = extractor.nlp(text)
+    assert extractor.extract_witnesses(text) == baseline_witnesses(text, doc)
+    assert extractor.extract_witnesses(text, doc=doc) == baseline_witnesses(text, doc)
+
+
+def test_witness_keyword_priority_follows_list_order(extractor):
+    # "victim" comes later in the text but earlier in WITNESS_KEYWORDS than "accused"
+    (witness,) = extractor.extract_witnesses("The accused Ramesh hit the victim.")
+    assert witness["type"] == "victim"
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_group_entities_matches_label_filter(extractor, text):
+    doc = extractor.nlp(text)
+    grouped = extractor.group_entities(doc)
+    assert set(grouped) == set(EvidenceExtractor.ENTITY_LABELS)
+    for label, ents in grouped.items():
+        assert ents == [(e.start_char, e.end_char, e.text) for e in doc.ents if e.label_ == label]
+
+
+@pytest.mark.parametrize("text", TEXTS + [DATE_TEXT])
+def test_patterns_match_baseline(text):
+    for baseline, compiled in (
+        (BASELINE_DOCUMENT_PATTERNS, EvidenceExtractor.DOCUMENT_PATTERNS),
+        (BASELINE_DATE_PATTERNS, EvidenceExtractor.DATE_PATTERNS),
+        (BASELINE_MONEY_PATTERNS, EvidenceExtractor.MONEY_PATTERNS),
+        (
+            [rf'\b{k}s?\b' for k in EvidenceExtractor.DOCUMENT_KEYWORDS],
+            [p for _, p in EvidenceExtractor.DOCUMENT_KEYWORD_PATTERNS],
+        ),
+    ):
+        expected = [[(m.span(), m.group(0)) for m in re.finditer(p, text, re.IGNORECASE)] for p in baseline]
+        assert spans(compiled, text) == expected
+
+
+def test_month_patterns_find_dates(extractor):
+    found = [d["date"] for d in extractor.extract_dates(DATE_TEXT, ents_by_label={"DATE": []})]
+    assert "January 5, 2024" in found and "Sept 9, 2020" in found and "Mayday 3 2021" in found
+    assert not any(d.startswith(("Jam", "Ma 2")) for d in found)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_shared_entities_match_per_extractor_parsing(extractor, text):
+    doc = extractor.nlp(text)
+    result = extractor.extract_evidence(text)
+    assert result["witnesses"] == extractor.extract_witnesses(text, doc=doc)
+    assert result["dates"] == extractor.extract_dates(text, doc=doc)
+    assert result["locations"] == extractor.extract_locations(text, doc=doc)
+    assert result["money"] == extractor.extract_money(text, doc=doc)
+
+
+def test_locations_keep_document_order(extractor):
+    locations = extractor.extract_locations(TEXTS[3] + " Then Delhi, MG Road and Bangalore.")
+    assert [(l["location"], l["type"]) for l in locations] == [
+        ("Cubbon Park", "loc"), ("Delhi", "gpe"), ("MG Road", "fac"), ("Bangalore", "gpe")
+    ]
+
+
+def test_extract_many_matches_extract_per_text(extractor):
+    assert extractor.extract_many(TEXTS) == [extractor.extract_evidence(text) for text in TEXTS]
+    assert extractor.extract_many([]) == []
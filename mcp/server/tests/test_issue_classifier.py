@@ -0,0 +1,120 @@
+"""Tests for keyword/embedding domain classification."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from tools.issue_classifier_tool import IssueClassifier
+
+
+@pytest.fixture
+def classifier():
+    """Classifier whose domain centroids are the unit axes, so tests need no model."""
+    classifier = IssueClassifier(use_onnx=False)
+    classifier.domain_centroids = np.eye(len(IssueClassifier.DOMAINS))
+    return classifier
+
+
+def embedding_towards(domain: str) -> "np.ndarray":
+    return np.eye(len(IssueClassifier.DOMAINS))[IssueClassifier.DOMAINS.index(domain)]
+
+
+def test_no_keyword_hits_stays_unknown_with_embeddings(classifier):
+    text = "The weather was pleasant yesterday."
+    assert not any(classifier.keyword_based_classification(text).values())
+    
+    result = classifier.classify(text, use_embeddings=True, embedding=embedding_towards("Cyber"))
+    assert result["domain"] == "Unknown"
+    assert result["secondary_issues"] == []
+
+
+def test_embedding_alone_adds_no_secondary_domain(classifier):
+    # "dowry harassment" is a Criminal issue but only a Family keyword
+    text = "She faced dowry harassment."
+    assert classifier.keyword_based_classification(text)["Criminal"] == 0
+    
+    result = classifier.classify(text, use_embeddings=True, embedding=embedding_towards("Criminal"))
+    assert result["domain"] == "Family"
+    assert result["primary_issue"] == "Dowry"
+    # Criminal scores 0.3 from the embedding but has no keyword hit
+    assert result["all_domain_scores"]["Criminal"] > 0.1
+    assert result["secondary_issues"] == []
+
+
+def test_embedding_breaks_keyword_tie(classifier):
+    text = "The murder was planned through hacking."
+    keyword_scores = classifier.keyword_based_classification(text)
+    assert keyword_scores["Criminal"] == keyword_scores["Cyber"] > 0
+    
+    result = classifier.classify(text, use_embeddings=True, embedding=embedding_towards("Cyber"))
+    assert result["domain"] == "Cyber"
+    assert result["primary_issue"] == "Hacking"
+    assert result["secondary_issues"] == ["Murder"]
+
+
+def test_keyword_only_classification(classifier):
+    result = classifier.classify("I received a phishing email", use_embeddings=False)
+    assert result["domain"] == "Cyber"
+    assert result["primary_issue"] == "Phishing"
+    assert result["method"] == "keywords"
+
+
+TEXTS = ["The accused hacked the bank server.", "A short one.", "Dowry harassment by the in-laws was reported to the police."]
+
+
+@pytest.fixture
+def tiny_bert(tmp_path):
+    """Randomly initialized small BERT and a word-level tokenizer, built offline."""
+    import torch
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    words = sorted({w.strip(".").lower() for text in TEXTS for w in text.split()})
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "export"] + words))
+    tokenizer = BertTokenizerFast(vocab_file=str(vocab_file))
+
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=tokenizer.vocab_size, hidden_size=64, num_hidden_layers=2,
+        num_attention_heads=2, intermediate_size=128
+    )
+    return tokenizer, BertModel(config).eval()
+
+
+def torch_embeddings(tokenizer, model, texts):
+    import torch
+
+    inputs = tokenizer(texts, return_tensors="pt", padding=True)
+    with torch.no_grad():
+        return model(**inputs).last_hidden_state[:, 0, :].numpy()
+
+
+def test_onnx_embeddings_match_torch(tiny_bert, tmp_path, monkeypatch):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+    import model_loader as model_loader_module
+    from tools import issue_classifier_tool
+
+    tokenizer, model = tiny_bert
+    expected = torch_embeddings(tokenizer, model, TEXTS)
+
+    loader = model_loader_module.ModelLoader(models_dir=tmp_path / "models")
+    monkeypatch.setattr(loader, "load_model", lambda name: (tokenizer, model))
+    monkeypatch.setattr(issue_classifier_tool, "model_loader", loader)
+
+    classifier = IssueClassifier(use_onnx=True)
+    assert classifier.load_model()
+    assert classifier.session is not None
+    assert (tmp_path / "models" / "law-ai_InLegalBERT" / "onnx" / "model-int8.onnx").exists()
+    # The PyTorch weights are released once the session serves embeddings
+    assert classifier.model is None
+
+    embeddings = classifier.get_text_embeddings(TEXTS, batch_size=2)
+    assert embeddings.shape == expected.shape
+    cosine = (embeddings * expected).sum(axis=1) / (
+        np.linalg.norm(embeddings, axis=1) * np.linalg.norm(expected, axis=1)
+    )
+    assert cosine.min() > 0.999
+    np.testing.assert_allclose(embeddings, expected, atol=0.1)
@@ -0,0 +1,253 @@
+"""Tests for legal analysis prompts, caching and the sync, async and streaming paths."""
+
+import asyncio
+import logging
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("diskcache")
+
+import numpy as np
+
+from tools.legal_analyzer_tool import LegalAnalyzer, SemanticCache
+
+
+SECTIONS = [
+    {"act": "IPC", "section": "420", "title": "Cheating", "description": "d1", "punishment": "7 years"},
+    {"act": "IT_ACT", "section": "66", "title": "Hacking", "description": "d2"},
+]
+
+EVIDENCE = {
+    "witnesses": [
+        {"name": "A", "is_witness": True},
+        {"name": "B", "is_witness": False},
+        {"name": "C", "is_witness": True},
+    ],
+    "documents": [{"reference": f"doc{i}"} for i in range(5)],
+    "dates": [{"date": "1 Jan"}, {"date": "2 Jan"}, {"date": "3 Jan"}],
+    "locations": [{"location": "Delhi"}],
+}
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    return LegalAnalyzer(cache_dir=str(tmp_path))
+
+
+def test_cache_opens_on_first_lookup(tmp_path):
+    cache_dir = tmp_path / "llm_cache"
+    analyzer = LegalAnalyzer(cache_dir=str(cache_dir))
+    assert not cache_dir.exists()
+    key = analyzer.cache.make_key("f", SECTIONS, "Criminal", None)
+    assert analyzer.cache.get(key) is None
+    assert cache_dir.exists()
+
+
+def test_default_cache_dir_is_outside_the_source_tree():
+    from tools.legal_analyzer_tool import LLM_CACHE_DIR
+
+    source_root = Path(__file__).resolve().parents[3]
+    assert source_root not in LLM_CACHE_DIR.resolve().parents
+
+
+def test_prompt_lists_sections_and_capped_evidence(analyzer):
+    prompt = analyzer.generate_analysis_prompt("facts here", SECTIONS, "Criminal", EVIDENCE)
+    assert "**Case Facts:**\nfacts here\n" in prompt
+    assert "**Legal Domain:** Criminal" in prompt
+    assert "1. **IPC Section 420**: Cheating\n   Description: d1\n   Punishment: 7 years\n" in prompt
+    assert "2. **IT_ACT Section 66**: Hacking\n   Description: d2\n\n" in prompt
+    assert "- Witnesses: A, C\n" in prompt
+    assert "- Documents: doc0, doc1, doc2\n" in prompt
+    assert "- Dates: 1 Jan, 2 Jan\n" in prompt
+    assert "- Locations: Delhi\n" in prompt
+
+
+def test_prompt_defaults_without_domain_or_evidence(analyzer):
+    prompt = analyzer.generate_analysis_prompt("f", [], None, None)
+    assert "**Legal Domain:** Not specified" in prompt
+    assert "Evidence Available" not in prompt
+
+
+def test_prompt_accepts_unhashable_section_values(analyzer):
+    sections = [dict(SECTIONS[0], punishment=["fine", "imprisonment"])]
+    prompt = analyzer.generate_analysis_prompt("f", sections, "Criminal", None)
+    assert "Punishment: ['fine', 'imprisonment']" in prompt
+
+
+def test_prompt_keeps_dollar_signs_literal(analyzer):
+    sections = [dict(SECTIONS[0], description="fine of $500 or ${facts}")]
+    prompt = analyzer.generate_analysis_prompt("paid $$ 10", sections, "$domain", None)
+    assert "Description: fine of $500 or ${facts}\n" in prompt
+    assert "**Case Facts:**\npaid $$ 10\n" in prompt
+    assert "**Legal Domain:** $domain" in prompt
+
+
+def test_prompt_reuses_section_block_across_facts(analyzer):
+    from tools.legal_analyzer_tool import _case_template
+
+    _case_template.cache_clear()
+    prompts = [analyzer.generate_analysis_prompt(f"case {i}", SECTIONS, "Criminal", None) for i in range(3)]
+    assert _case_template.cache_info().hits == 2
+    assert prompts[2] == prompts[0].replace("case 0", "case 2")
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield FakeResponse(chunk)
+
+
+class FakeModel:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        return FakeResponse("".join(self.chunks))
+
+    async def generate_content_async(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        if stream:
+            return FakeStream(self.chunks)
+        return FakeResponse("".join(self.chunks))
+
+
+@pytest.fixture
+def api_analyzer(tmp_path, monkeypatch):
+    """Analyzer with a fake Gemini model and caches that always miss."""
+    import tools.legal_analyzer_tool as module
+
+    model = FakeModel(["Analysis ", "of the ", "case. "])
+    analyzer = LegalAnalyzer(gemini_api_key="test-key", cache_dir=str(tmp_path))
+    stored = []
+    monkeypatch.setattr(LegalAnalyzer, "_get_shared_model", classmethod(lambda cls, key=None: model))
+    monkeypatch.setattr(module, "_retryable_gemini_errors", lambda: (asyncio.TimeoutError,))
+    monkeypatch.setattr(analyzer, "_lookup_cached_analysis", lambda *args: {"analysis": None, "method": None})
+    monkeypatch.setattr(analyzer, "_store_analysis", lambda lookup, text: stored.append(text))
+    return analyzer, model, stored
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def test_async_analysis_without_api_key(analyzer):
+    analyzer.has_api = False
+    result = asyncio.run(analyzer.analyze_case_async("f", SECTIONS, "Criminal"))
+    assert result["method"] == "no_api"
+    assert result["error"] == "API key not configured"
+
+
+def test_async_analysis_matches_result_shape(api_analyzer):
+    analyzer, model, stored = api_analyzer
+    result = asyncio.run(analyzer.analyze_case_async("facts here", SECTIONS, "Criminal", EVIDENCE))
+    assert result["analysis"] == "Analysis of the case."
+    assert result["method"] == "gemini_api"
+    assert result["sections_analyzed"] == 2
+    assert result["has_evidence"] is True
+    assert result["sections_summary"][1] == {"act": "IT_ACT", "section": "66", "title": "Hacking"}
+    assert model.prompts == [analyzer.generate_analysis_prompt("facts here", SECTIONS, "Criminal", EVIDENCE)]
+    assert stored == ["Analysis of the case."]
+
+
+def test_stream_yields_chunks_and_caches_full_text(api_analyzer):
+    analyzer, _, stored = api_analyzer
+    chunks = asyncio.run(collect(analyzer.stream_analysis_async("facts here", SECTIONS, "Criminal")))
+    assert chunks == ["Analysis ", "of the ", "case. "]
+    assert stored == ["Analysis of the case."]
+
+
+def test_stream_without_api_key_yields_notice(analyzer):
+    analyzer.has_api = False
+    chunks = asyncio.run(collect(analyzer.stream_analysis_async("f", SECTIONS)))
+    assert len(chunks) == 1 and "API key" in chunks[0]
+
+
+def test_analyze_many_keeps_case_order(api_analyzer):
+    analyzer, model, _ = api_analyzer
+    cases = [{"facts": f"case {i}", "sections": SECTIONS[:i % 2 + 1]} for i in range(5)]
+    results = asyncio.run(analyzer.analyze_many(cases))
+    assert [r["sections_analyzed"] for r in results] == [1, 2, 1, 2, 1]
+    assert [r["facts_length"] for r in results] == [6] * 5
+    assert len(model.prompts) == 5
+
+
+@pytest.mark.parametrize("chunks", [["Analysis ", "of the ", "case. "], None])
+def test_sync_and_async_analysis_agree(api_analyzer, chunks):
+    analyzer, model, stored = api_analyzer
+    # None makes the model fail, so both paths report the same error
+    model.chunks = chunks
+    sync_result = analyzer.analyze_case("facts here", SECTIONS, "Criminal", EVIDENCE)
+    async_result = asyncio.run(analyzer.analyze_case_async("facts here", SECTIONS, "Criminal", EVIDENCE))
+    assert sync_result == async_result
+    assert sync_result["method"] == ("gemini_api" if chunks else "error")
+    assert stored == (["Analysis of the case."] * 2 if chunks else [])
+
+
+class StubEncoder:
+    """Embeds each text as a unit vector at its given angle to the first axis."""
+
+    angles = {"base": 0.0}
+
+    def __init__(self, name):
+        pass
+
+    def encode(self, texts, normalize_embeddings=False):
+        vectors = np.zeros((len(texts), SemanticCache.DIMENSION))
+        for row, text in zip(vectors, texts):
+            angle = self.angles[text]
+            row[:2] = np.cos(angle), np.sin(angle)
+        return vectors
+
+
+def loaded(cache):
+    """Trigger the background load and wait for it."""
+    assert cache.encode("base") is None
+    cache._loader.join()
+    return cache
+
+
+@pytest.fixture
+def semantic_cache(tmp_path, monkeypatch):
+    pytest.importorskip("faiss")
+    monkeypatch.setitem(sys.modules, "sentence_transformers", types.SimpleNamespace(SentenceTransformer=StubEncoder))
+    return loaded(SemanticCache(tmp_path))
+
+
+@pytest.mark.parametrize("similarity, hit", [(0.95, True), (0.921, True), (0.919, False), (0.5, False)])
+def test_semantic_cache_similarity_threshold(semantic_cache, similarity, hit):
+    StubEncoder.angles["paraphrase"] = np.arccos(similarity)
+    semantic_cache.add(semantic_cache.encode("base"), "sections", "cached analysis")
+    result = semantic_cache.lookup(semantic_cache.encode("paraphrase"), "sections")
+    assert result == ("cached analysis" if hit else None)
+
+
+def test_semantic_cache_requires_same_sections(semantic_cache):
+    semantic_cache.add(semantic_cache.encode("base"), "sections", "cached analysis")
+    assert semantic_cache.lookup(semantic_cache.encode("base"), "other sections") is None
+
+
+def test_semantic_cache_gives_up_once_when_unavailable(tmp_path, monkeypatch, caplog):
+    monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+    with caplog.at_level(logging.WARNING):
+        cache = loaded(SemanticCache(tmp_path))
+        loader = cache._loader
+        assert all(cache.encode("base") is None for _ in range(3))
+    assert cache.unavailable and cache._loader is loader
+    assert len(caplog.records) == 1
@@ -0,0 +1,41 @@
+"""Tests for shared document state and section normalization."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from legal_doc import NormalizedSection, get_legal_doc, normalize_sections
+
+
+def test_missing_section_fields_get_display_defaults():
+    (section,) = normalize_sections([{}])
+    assert section == NormalizedSection("Unknown", "N/A", "", "", "", None, None)
+
+
+def test_section_fields_are_kept():
+    raw = {
+        "act": "IPC", "section": "420", "title": "Cheating", "description": "d",
+        "punishment": "7 years", "bailable": False, "cognizable": True, "extra": "ignored",
+    }
+    (section,) = normalize_sections([raw])
+    assert section == NormalizedSection("IPC", "420", "Cheating", "d", "7 years", False, True)
+
+
+def test_explicit_none_is_not_replaced():
+    (section,) = normalize_sections([{"act": None, "title": None}])
+    assert section.act is None
+    assert section.title is None
+
+
+def test_normalized_sections_pass_through():
+    section = NormalizedSection("IT_ACT", "66", "Hacking", "", "", None, None)
+    normalized = normalize_sections([section, {"act": "BNS"}])
+    assert normalized[0] is section
+    assert normalized[1].act == "BNS"
+
+
+def test_legal_doc_is_shared_per_text():
+    doc = get_legal_doc("The accused cheated the complainant.")
+    assert get_legal_doc("The accused cheated the complainant.") is doc
+    assert get_legal_doc("Another case.") is not doc
+    assert doc.spacy_doc is None and doc.cls_embedding is None
@@ -0,0 +1,90 @@
+"""Tests for the markdown/PDF report generator."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from tools.report_generator_tool import ReportGenerator
+
+
+def make_case(seed: int) -> dict:
+    """Case data long enough to span several pages, varied by seed."""
+    sections = [
+        {
+            "act": "IPC",
+            "section": str(300 + i),
+            "title": f"Offence {i}",
+            "description": "Whoever commits the offence shall be punished. " * (1 + (i + seed) % 7),
+            "punishment": "Imprisonment up to 3 years" if i % 2 else "",
+            "bailable": bool(i % 3),
+            "cognizable": bool(i % 2),
+        }
+        for i in range(3 + seed % 9)
+    ]
+    analysis = "\n".join(
+        [f"## Point {i}\n\n" + "The **accused** acted knowingly. " * (5 + (i * seed) % 23) for i in range(6 + seed % 5)]
+        + ["| Issue | Finding |", "|---|---|", "| Intent | Established |"]
+    )
+    return {
+        "facts": "On the night of the incident the complainant was attacked. " * (10 + seed),
+        "domain": "Criminal",
+        "primary_issue": "Assault",
+        "secondary_issues": ["Theft"],
+        "sections": sections,
+        "evidence": {
+            "witnesses": [{"name": f"Witness {i}", "type": "eyewitness", "is_witness": True} for i in range(seed % 4)],
+            "dates": [{"date": "12 March 2024"}],
+        },
+        "analysis": analysis,
+    }
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return ReportGenerator(documents_dir=str(tmp_path))
+
+
+def test_multi_page_reports_render(generator):
+    # Many varied reports in one process, so flowables landing at page
+    # bottoms in earlier builds cannot leak into later ones
+    for seed in range(40):
+        result = generator.generate_report(f"CASE_{seed}", make_case(seed))
+        assert "error" not in result, result.get("error")
+        assert result["report_size_kb"] > 0
+
+
+def test_report_writes_markdown(generator):
+    result = generator.generate_report("CASE_MD", make_case(3))
+    with open(result["markdown_path"], encoding="utf-8") as f:
+        markdown = f.read()
+    assert markdown.startswith("# Legal Case Analysis Report")
+    assert "## 3. Applicable Legal Sections" in markdown
+    assert "IPC Section 300" in markdown
+
+
+def page_count(pdf_path: str) -> int:
+    with open(pdf_path, "rb") as f:
+        return f.read().count(b"/Type /Page\n")
+
+
+def test_concurrent_async_reports_render(generator):
+    # generate_report_async builds PDFs in worker threads; concurrent
+    # builds must not share flowables
+    cases = {f"CASE_ASYNC_{seed}": make_case(seed) for seed in range(12)}
+    
+    async def render_all():
+        return await asyncio.gather(*(
+            generator.generate_report_async(case_id, case_data)
+            for case_id, case_data in cases.items()
+        ))
+    
+    results = asyncio.run(render_all())
+    for result in results:
+        assert "error" not in result, result.get("error")
+    
+    # Same layout as rendering each report on its own
+    for result in results:
+        expected = generator.generate_report(result["case_id"] + "_SEQ", cases[result["case_id"]])
+        assert page_count(result["pdf_path"]) == page_count(expected["pdf_path"]) > 1
@@ -0,0 +1,188 @@
+"""Tests for issue -> section mapping and section search."""
+
+import json
+import random
+
+import pytest
+
+from tools.section_mapper_tool import SectionMapper
+
+
+# Issue keys each issue name resolves to, per act (acts not listed match
+# nothing). Covers every IssueClassifier.COMMON_ISSUES name.
+EXPECTED_ISSUE_KEYS = {
+    "Assault": {"IPC": "Assault", "BNS": "Assault"},
+    "Murder": {"IPC": "Murder", "BNS": "Murder"},
+    "Theft": {"IPC": "Theft", "BNS": "Theft", "IT_ACT": "Identity Theft"},
+    "Robbery": {},
+    "Fraud/Cheating": {"IPC": "Fraud/Cheating", "BNS": "Fraud/Cheating"},
+    "Rape/Sexual Assault": {"IPC": "Rape/Sexual Assault", "BNS": "Assault"},
+    "Kidnapping": {"IPC": "Kidnapping"},
+    "Extortion": {},
+    "Bribery": {},
+    "Corruption": {},
+    "Domestic Violence": {"IPC": "Domestic Violence"},
+    "Dowry Harassment": {"IPC": "Dowry"},
+    "Breach of Contract": {},
+    "Property Dispute": {},
+    "Defamation": {},
+    "Negligence": {},
+    "Money Recovery": {},
+    "Injunction": {},
+    "Divorce": {},
+    "Child Custody": {},
+    "Alimony/Maintenance": {},
+    "Dowry": {"IPC": "Dowry"},
+    "Adoption": {},
+    "Inheritance": {},
+    "Online Fraud": {},
+    "Hacking": {"IT_ACT": "Hacking"},
+    "Phishing": {"IT_ACT": "Phishing"},
+    "Identity Theft": {"IPC": "Theft", "BNS": "Theft", "IT_ACT": "Identity Theft"},
+    "Data Breach": {"IT_ACT": "Data Breach"},
+    "Cyberbullying": {"IT_ACT": "Cyberbullying"},
+    "Banking Fraud": {},
+    "Defective Product": {},
+    "Service Deficiency": {},
+    "Unfair Trade Practice": {},
+    "Warranty Claim": {},
+    "Refund Dispute": {},
+    "Wrongful Termination": {},
+    "Wage Dispute": {},
+    "Working Conditions": {},
+    "Harassment at Workplace": {},
+    "Non-payment of Dues": {},
+    "Eviction": {},
+    "Rent Dispute": {},
+    "Title Dispute": {},
+    "Encroachment": {},
+    "Possession Dispute": {},
+    # Loose inputs that partial matching used to attach statutes to
+    "Other": {},
+    "Insult": {},
+    "Loan default": {},
+    "Rent": {},
+    "Accident": {},
+}
+
+
+@pytest.fixture(scope="module")
+def mapper():
+    return SectionMapper()
+
+
+def matched_keys(mapper, result):
+    """Issue key behind each act's sections in a get_sections_for_issue result."""
+    keys = {}
+    for act, sections in result.items():
+        if act.endswith("_note"):
+            continue
+        keys[act] = next(
+            key for key, value in mapper.sections_data[act].items() if value is sections
+        )
+    return keys
+
+
+@pytest.mark.parametrize("issue", sorted(EXPECTED_ISSUE_KEYS))
+def test_issue_maps_to_expected_keys(mapper, issue):
+    result = mapper.get_sections_for_issue(issue)
+    assert matched_keys(mapper, result) == EXPECTED_ISSUE_KEYS[issue]
+
+
+@pytest.mark.parametrize("domain, issue, unexpected", [
+    ("Criminal", "Fraud/Cheating", "CrPC"),
+    ("Cyber", "Hacking", "IPC"),
+    ("Cyber", "Hacking", "BNS"),
+    ("Cyber", "Banking Fraud", "IT_ACT"),
+])
+def test_map_sections_adds_no_unrelated_acts(mapper, domain, issue, unexpected):
+    result = mapper.map_sections(domain, issue)
+    assert unexpected not in result["primary_sections"]
+    assert unexpected not in result["summary"]["acts_covered"]
+
+
+
+@pytest.mark.parametrize("domain, issue, secondary", [
+    ("Criminal", "Murder", ["Theft", "Assault"]),
+    ("Cyber", "Hacking", None),
+    ("Family", "Dowry Harassment", ["Domestic Violence"]),
+    ("Civil", "Contract Breach", ["Unknown issue"]),
+])
+def test_map_sections_bytes_matches_map_sections(mapper, domain, issue, secondary):
+    expected = mapper.map_sections(domain, issue, secondary)
+    assert json.loads(mapper.map_sections_bytes(domain, issue, secondary)) == json.loads(json.dumps(expected))
+
+
+def test_map_sections_returns_plain_dicts(mapper):
+    result = mapper.map_sections("Criminal", "Murder", ["Theft"])
+    assert result["all_sections"]
+    assert all(type(s) is dict for s in result["all_sections"])
+
+
+def test_common_issues_are_all_covered():
+    issue_classifier_tool = pytest.importorskip("tools.issue_classifier_tool")
+    names = {
+        issue
+        for issues in issue_classifier_tool.IssueClassifier.COMMON_ISSUES.values()
+        for issue in issues
+    }
+    assert names <= set(EXPECTED_ISSUE_KEYS)
+
+
+@pytest.mark.parametrize("issue, expected", [
+    ("Assualt", {"IPC": "Assault", "BNS": "Assault"}),
+    ("murdr", {"IPC": "Murder", "BNS": "Murder"}),
+    ("Hackng", {"IT_ACT": "Hacking"}),
+    ("Kidnaping", {"IPC": "Kidnapping"}),
+    # Containment wins over a key two edits away ("theft")
+    ("cheat", {"IPC": "Fraud/Cheating", "BNS": "Fraud/Cheating"}),
+    # Short issues allow one edit per three characters ("bail" is two away)
+    ("Bial", {}),
+    ("fbi", {}),
+    ("zzzz", {}),
+])
+def test_misspelled_issue_maps_to_closest_key(mapper, issue, expected):
+    result = mapper.get_sections_for_issue(issue)
+    assert matched_keys(mapper, result) == expected
+
+
+def test_lowercase_issue_matches_key(mapper):
+    result = mapper.get_sections_for_issue("fraud/cheating", ["IPC"])
+    assert result["IPC"] is mapper.sections_data["IPC"]["Fraud/Cheating"]
+
+
+@pytest.mark.parametrize("query", [
+    "theft", "Theft", "punish", "property", "66", "66C", "420", "of the", "(", "", "no such words",
+    "heft", "eft of", "of th", " theft ", "ishment", "n of a", "t, ", "-",
+])
+def test_search_matches_full_scan(mapper, query):
+    assert mapper.search_sections(query) == mapper.search_sections(query, fallback=True)
+
+
+def test_search_matches_full_scan_on_field_substrings(mapper):
+    # Substrings cut at arbitrary points inside and across words
+    rng = random.Random(0)
+    fields = [f for s in mapper.search_sections("", fallback=True) for f in (s.get("title"), s.get("description")) if f]
+    for _ in range(300):
+        field = rng.choice(fields)
+        start = rng.randrange(len(field))
+        query = field[start:start + rng.randint(1, 20)]
+        assert mapper.search_sections(query) == mapper.search_sections(query, fallback=True), query
+
+
+def test_search_smart_case(mapper):
+    insensitive = mapper.search_sections("theft")
+    sensitive = mapper.search_sections("Theft", smart_case=True)
+    assert sensitive and len(sensitive) < len(insensitive)
+    assert all("Theft" in s["title"] or "Theft" in s["description"] for s in sensitive)
+    # Section numbers are matched as written
+    assert [s["section"] for s in mapper.search_sections("66C", smart_case=True)] == ["66C"]
+
+
+@pytest.mark.parametrize("keywords", [
+    ["theft"], ["theft", "property"], ["Hacking", "cheat"], ["420", "66c"], ["of", "of the"], ["", "  "], ["no-such-word"],
+])
+def test_search_keywords_matches_any_keyword_scan(mapper, keywords):
+    matches = [mapper.search_sections(k.strip(), fallback=True) for k in keywords if k.strip()]
+    expected = [s for s in mapper.search_sections("", fallback=True) if any(s in m for m in matches)]
+    assert mapper.search_keywords(keywords) == expected
@@ -10,11 +10,15 @@ Extracts evidence from legal text including:
 - Other entities
 """
 
+import os
 import re
 import logging
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
 import spacy
+from legal_doc import LegalDoc
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +35,14 @@ class EvidenceExtractor:
         "complainant", "informant", "victim", "accused"
     ]
     
+    # Keyword priority (list order) and a single-pass matcher for all keywords.
+    # The lookahead lets overlapping hits (e.g. "witness" in "witnesses") through.
+    WITNESS_KEYWORD_PRIORITY = {kw: i for i, kw in enumerate(WITNESS_KEYWORDS)}
+    WITNESS_KEYWORD_PATTERN = re.compile(
+        "(?=(" + "|".join(map(re.escape, WITNESS_KEYWORDS)) + "))",
+        re.IGNORECASE | re.ASCII
+    )
+    
     # Document keywords
     DOCUMENT_KEYWORDS = [
         "document", "documents", "evidence", "proof", "certificate",
@@ -40,6 +52,41 @@ class EvidenceExtractor:
         "photograph", "photo", "video", "cctv", "recording"
     ]
     
+    # Regex patterns are compiled once here instead of on every call
+    
+    # Document references
+    DOCUMENT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'(?:document|evidence|exhibit)\s+(?:no\.?|number)?\s*([A-Z0-9\-/]+)',
+        r'(?:receipt|invoice|bill)\s+(?:no\.?|number)?\s*([A-Z0-9\-/]+)',
+        r'(?:email|letter)\s+dated\s+([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})',
+        r'(CCTV\s+footage|video\s+recording|photograph)',
+        r'(WhatsApp\s+chat|SMS|text\s+message)',
+    ))
+    
+    DOCUMENT_KEYWORD_PATTERNS = tuple(
+        (keyword, re.compile(rf'\b{keyword}s?\b', re.IGNORECASE))
+        for keyword in DOCUMENT_KEYWORDS
+    )
+    
+    # Common date formats. Month names are a prefix-factored alternation so the
+    # engine rejects a non-month word after one or two characters.
+    DATE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # DD/MM/YYYY or DD-MM-YYYY
+        r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',    # YYYY/MM/DD
+        r'\b(?:J(?:an|u[nl])|Feb|Ma[ry]|A(?:pr|ug)|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b',  # Month DD, YYYY
+    ))
+    
+    # Indian currency
+    MONEY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'Rs\.?\s*\d+(?:,\d+)*(?:\.\d+)?',  # Rs. 1,000 or Rs 1000
+        r'INR\s*\d+(?:,\d+)*(?:\.\d+)?',    # INR 1000
+        r'₹\s*\d+(?:,\d+)*(?:\.\d+)?',      # ₹1000
+    ))
+    
+    # Entity labels consumed by the extractors
+    ENTITY_LABELS = ("PERSON", "DATE", "GPE", "LOC", "FAC", "MONEY")
+    LOCATION_LABELS = ("GPE", "LOC", "FAC")  # Geo-political entity, Location, Facility
+    
     def __init__(self):
         """Initialize the EvidenceExtractor."""
         self.nlp = None
@@ -55,52 +102,98 @@ class EvidenceExtractor:
             logger.error(f"Error loading spaCy model: {str(e)}")
             logger.info("Please run: python -m spacy download en_core_web_sm")
     
-    def extract_witnesses(self, text: str, doc: Optional[spacy.tokens.Doc] = None) -> List[Dict[str, Any]]:
+    def group_entities(self, doc: spacy.tokens.Doc) -> Dict[str, List[Tuple[int, int, str]]]:
+        """
+        Bucket the doc's entities by label in a single pass.
+        
+        Args:
+            doc: Pre-processed spaCy doc
+            
+        Returns:
+            Dict of label -> list of (start_char, end_char, text), in doc order
+        """
+        ents_by_label = {label: [] for label in self.ENTITY_LABELS}
+        for ent in doc.ents:
+            bucket = ents_by_label.get(ent.label_)
+            if bucket is not None:
+                bucket.append((ent.start_char, ent.end_char, ent.text))
+        return ents_by_label
+    
+    def _resolve_entities(
+        self,
+        text: str,
+        doc: Optional[spacy.tokens.Doc],
+        ents_by_label: Optional[Dict[str, List[Tuple[int, int, str]]]]
+    ) -> Optional[Dict[str, List[Tuple[int, int, str]]]]:
+        """Return grouped entities, running spaCy only if nothing was passed in."""
+        if ents_by_label is not None:
+            return ents_by_label
+        
+        if doc is None and self.nlp:
+            doc = self.nlp(text)
+        
+        return self.group_entities(doc) if doc is not None else None
+    
+    def extract_witnesses(
+        self,
+        text: str,
+        doc: Optional[spacy.tokens.Doc] = None,
+        ents_by_label: Optional[Dict[str, List[Tuple[int, int, str]]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract witnesses from text.
         
         Args:
             text: Input text
             doc: Optional pre-processed spaCy doc
+            ents_by_label: Optional entities already grouped by group_entities
             
         Returns:
             List of witnesses with context
         """
         witnesses = []
         
-        if doc is None and self.nlp:
-            doc = self.nlp(text)
-        
-        if doc is None:
+        ents_by_label = self._resolve_entities(text, doc, ents_by_label)
+        if ents_by_label is None:
             return witnesses
         
-        # Extract persons mentioned with witness keywords
-        text_lower = text.lower()
+        # Scan the text once for all witness keywords, sorted by position
+        keyword_hits = [
+            (m.start(), m.group(1).lower())
+            for m in self.WITNESS_KEYWORD_PATTERN.finditer(text)
+        ]
+        hit_positions = [pos for pos, _ in keyword_hits]
         
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                # Get context around the person
-                start_idx = max(0, ent.start_char - 50)
-                end_idx = min(len(text), ent.end_char + 50)
-                context = text[start_idx:end_idx].strip()
-                
-                # Check if mentioned with witness keywords
-                is_witness = False
-                witness_type = "person"
-                
-                for keyword in self.WITNESS_KEYWORDS:
-                    if keyword in context.lower():
-                        is_witness = True
-                        witness_type = keyword
-                        break
-                
-                witnesses.append({
-                    "name": ent.text,
-                    "type": witness_type,
-                    "is_witness": is_witness,
-                    "context": context,
-                    "position": {"start": ent.start_char, "end": ent.end_char}
-                })
+        for ent_start, ent_end, ent_text in ents_by_label["PERSON"]:
+            # Get context around the person
+            start_idx = max(0, ent_start - 50)
+            end_idx = min(len(text), ent_end + 50)
+            context = text[start_idx:end_idx].strip()
+            
+            # Check if mentioned with witness keywords: only hits starting
+            # inside the context window need to be looked at
+            is_witness = False
+            witness_type = "person"
+            
+            lo = bisect_left(hit_positions, start_idx)
+            hi = bisect_right(hit_positions, end_idx)
+            best = None
+            for pos, keyword in keyword_hits[lo:hi]:
+                if pos + len(keyword) > end_idx:
+                    continue
+                priority = self.WITNESS_KEYWORD_PRIORITY[keyword]
+                if best is None or priority < best:
+                    best = priority
+                    witness_type = keyword
+                    is_witness = True
+            
+            witnesses.append({
+                "name": ent_text,
+                "type": witness_type,
+                "is_witness": is_witness,
+                "context": context,
+                "position": {"start": ent_start, "end": ent_end}
+            })
         
         logger.info(f"Extracted {len(witnesses)} potential witnesses")
         return witnesses
@@ -118,17 +211,8 @@ class EvidenceExtractor:
         documents = []
         text_lower = text.lower()
         
-        # Pattern for document references
-        patterns = [
-            r'(?:document|evidence|exhibit)\s+(?:no\.?|number)?\s*([A-Z0-9\-/]+)',
-            r'(?:receipt|invoice|bill)\s+(?:no\.?|number)?\s*([A-Z0-9\-/]+)',
-            r'(?:email|letter)\s+dated\s+([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})',
-            r'(CCTV\s+footage|video\s+recording|photograph)',
-            r'(WhatsApp\s+chat|SMS|text\s+message)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in self.DOCUMENT_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 # Get context
                 start_idx = max(0, match.start() - 50)
@@ -143,9 +227,9 @@ class EvidenceExtractor:
                 })
         
         # Also check for general document keywords
-        for keyword in self.DOCUMENT_KEYWORDS:
-            pattern = rf'\b{keyword}s?\b'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        seen_references = {d["reference"] for d in documents}
+        for keyword, pattern in self.DOCUMENT_KEYWORD_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 # Get context
                 start_idx = max(0, match.start() - 50)
@@ -153,7 +237,8 @@ class EvidenceExtractor:
                 context = text[start_idx:end_idx].strip()
                 
                 # Avoid duplicates
-                if not any(d["reference"] == match.group(0) for d in documents):
+                if match.group(0) not in seen_references:
+                    seen_references.add(match.group(0))
                     documents.append({
                         "reference": match.group(0),
                         "type": keyword,
@@ -164,50 +249,50 @@ class EvidenceExtractor:
         logger.info(f"Extracted {len(documents)} document references")
         return documents
     
-    def extract_dates(self, text: str, doc: Optional[spacy.tokens.Doc] = None) -> List[Dict[str, Any]]:
+    def extract_dates(
+        self,
+        text: str,
+        doc: Optional[spacy.tokens.Doc] = None,
+        ents_by_label: Optional[Dict[str, List[Tuple[int, int, str]]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract dates from text.
         
         Args:
             text: Input text
             doc: Optional pre-processed spaCy doc
+            ents_by_label: Optional entities already grouped by group_entities
             
         Returns:
             List of dates
         """
         dates = []
         
-        if doc is None and self.nlp:
-            doc = self.nlp(text)
+        ents_by_label = self._resolve_entities(text, doc, ents_by_label)
         
         # Extract DATE entities from spaCy
-        if doc:
-            for ent in doc.ents:
-                if ent.label_ == "DATE":
-                    # Get context
-                    start_idx = max(0, ent.start_char - 50)
-                    end_idx = min(len(text), ent.end_char + 50)
-                    context = text[start_idx:end_idx].strip()
-                    
-                    dates.append({
-                        "date": ent.text,
-                        "type": "date",
-                        "context": context,
-                        "position": {"start": ent.start_char, "end": ent.end_char}
-                    })
+        if ents_by_label:
+            for ent_start, ent_end, ent_text in ents_by_label["DATE"]:
+                # Get context
+                start_idx = max(0, ent_start - 50)
+                end_idx = min(len(text), ent_end + 50)
+                context = text[start_idx:end_idx].strip()
+                
+                dates.append({
+                    "date": ent_text,
+                    "type": "date",
+                    "context": context,
+                    "position": {"start": ent_start, "end": ent_end}
+                })
         
         # Also use regex for common date formats
-        date_patterns = [
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # DD/MM/YYYY or DD-MM-YYYY
-            r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',    # YYYY/MM/DD
-            r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b',  # Month DD, YYYY
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        seen_dates = {d["date"] for d in dates}
+        for pattern in self.DATE_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 # Avoid duplicates
-                if not any(d["date"] == match.group(0) for d in dates):
+                if match.group(0) not in seen_dates:
+                    seen_dates.add(match.group(0))
                     # Get context
                     start_idx = max(0, match.start() - 50)
                     end_idx = min(len(text), match.end() + 50)
@@ -223,84 +308,95 @@ class EvidenceExtractor:
         logger.info(f"Extracted {len(dates)} dates")
         return dates
     
-    def extract_locations(self, text: str, doc: Optional[spacy.tokens.Doc] = None) -> List[Dict[str, Any]]:
+    def extract_locations(
+        self,
+        text: str,
+        doc: Optional[spacy.tokens.Doc] = None,
+        ents_by_label: Optional[Dict[str, List[Tuple[int, int, str]]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract locations from text.
         
         Args:
             text: Input text
             doc: Optional pre-processed spaCy doc
+            ents_by_label: Optional entities already grouped by group_entities
             
         Returns:
             List of locations
         """
         locations = []
         
-        if doc is None and self.nlp:
-            doc = self.nlp(text)
+        ents_by_label = self._resolve_entities(text, doc, ents_by_label)
         
-        if doc:
-            for ent in doc.ents:
-                if ent.label_ in ["GPE", "LOC", "FAC"]:  # Geo-political entity, Location, Facility
-                    # Get context
-                    start_idx = max(0, ent.start_char - 50)
-                    end_idx = min(len(text), ent.end_char + 50)
-                    context = text[start_idx:end_idx].strip()
-                    
-                    locations.append({
-                        "location": ent.text,
-                        "type": ent.label_.lower(),
-                        "context": context,
-                        "position": {"start": ent.start_char, "end": ent.end_char}
-                    })
+        if ents_by_label:
+            # Entities never overlap, so sorting by start restores doc order
+            location_ents = sorted(
+                (ent + (label.lower(),)
+                 for label in self.LOCATION_LABELS
+                 for ent in ents_by_label[label]),
+                key=lambda ent: ent[0]
+            )
+            for ent_start, ent_end, ent_text, ent_type in location_ents:
+                # Get context
+                start_idx = max(0, ent_start - 50)
+                end_idx = min(len(text), ent_end + 50)
+                context = text[start_idx:end_idx].strip()
+                
+                locations.append({
+                    "location": ent_text,
+                    "type": ent_type,
+                    "context": context,
+                    "position": {"start": ent_start, "end": ent_end}
+                })
         
         logger.info(f"Extracted {len(locations)} locations")
         return locations
     
-    def extract_money(self, text: str, doc: Optional[spacy.tokens.Doc] = None) -> List[Dict[str, Any]]:
+    def extract_money(
+        self,
+        text: str,
+        doc: Optional[spacy.tokens.Doc] = None,
+        ents_by_label: Optional[Dict[str, List[Tuple[int, int, str]]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract monetary amounts from text.
         
         Args:
             text: Input text
             doc: Optional pre-processed spaCy doc
+            ents_by_label: Optional entities already grouped by group_entities
             
         Returns:
             List of monetary amounts
         """
         amounts = []
         
-        if doc is None and self.nlp:
-            doc = self.nlp(text)
+        ents_by_label = self._resolve_entities(text, doc, ents_by_label)
         
         # Extract MONEY entities from spaCy
-        if doc:
-            for ent in doc.ents:
-                if ent.label_ == "MONEY":
-                    # Get context
-                    start_idx = max(0, ent.start_char - 50)
-                    end_idx = min(len(text), ent.end_char + 50)
-                    context = text[start_idx:end_idx].strip()
-                    
-                    amounts.append({
-                        "amount": ent.text,
-                        "type": "money",
-                        "context": context,
-                        "position": {"start": ent.start_char, "end": ent.end_char}
-                    })
+        if ents_by_label:
+            for ent_start, ent_end, ent_text in ents_by_label["MONEY"]:
+                # Get context
+                start_idx = max(0, ent_start - 50)
+                end_idx = min(len(text), ent_end + 50)
+                context = text[start_idx:end_idx].strip()
+                
+                amounts.append({
+                    "amount": ent_text,
+                    "type": "money",
+                    "context": context,
+                    "position": {"start": ent_start, "end": ent_end}
+                })
         
         # Also use regex for Indian currency
-        money_patterns = [
-            r'Rs\.?\s*\d+(?:,\d+)*(?:\.\d+)?',  # Rs. 1,000 or Rs 1000
-            r'INR\s*\d+(?:,\d+)*(?:\.\d+)?',    # INR 1000
-            r'₹\s*\d+(?:,\d+)*(?:\.\d+)?',      # ₹1000
-        ]
-        
-        for pattern in money_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        seen_amounts = {a["amount"] for a in amounts}
+        for pattern in self.MONEY_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 # Avoid duplicates
-                if not any(a["amount"] == match.group(0) for a in amounts):
+                if match.group(0) not in seen_amounts:
+                    seen_amounts.add(match.group(0))
                     # Get context
                     start_idx = max(0, match.start() - 50)
                     end_idx = min(len(text), match.end() + 50)
@@ -316,30 +412,46 @@ class EvidenceExtractor:
         logger.info(f"Extracted {len(amounts)} monetary amounts")
         return amounts
     
-    def extract_evidence(self, text: str) -> Dict[str, Any]:
+    def extract_evidence(
+        self,
+        text: Union[str, LegalDoc],
+        doc: Optional[spacy.tokens.Doc] = None
+    ) -> Dict[str, Any]:
         """
         Extract all evidence from text.
         
         Args:
-            text: Input text
+            text: Input text, or a shared LegalDoc whose cached spaCy doc is reused
+            doc: Optional pre-processed spaCy doc
             
         Returns:
             Dict with all extracted evidence
         """
+        legal_doc = None
+        if isinstance(text, LegalDoc):
+            legal_doc = text
+            text = legal_doc.text
+            if doc is None:
+                doc = legal_doc.spacy_doc
+        
         try:
             logger.info(f"Extracting evidence from text ({len(text)} chars)")
             
             # Process text with spaCy once
-            doc = None
-            if self.nlp:
+            if doc is None and self.nlp:
                 doc = self.nlp(text)
+                if legal_doc is not None:
+                    legal_doc.spacy_doc = doc
+            
+            # Group entities once and share them across the extractors
+            ents_by_label = self.group_entities(doc) if doc is not None else None
             
             # Extract all types of evidence
-            witnesses = self.extract_witnesses(text, doc)
+            witnesses = self.extract_witnesses(text, ents_by_label=ents_by_label)
             documents = self.extract_documents(text)
-            dates = self.extract_dates(text, doc)
-            locations = self.extract_locations(text, doc)
-            money = self.extract_money(text, doc)
+            dates = self.extract_dates(text, ents_by_label=ents_by_label)
+            locations = self.extract_locations(text, ents_by_label=ents_by_label)
+            money = self.extract_money(text, ents_by_label=ents_by_label)
             
             result = {
                 "witnesses": witnesses,
@@ -372,6 +484,36 @@ class EvidenceExtractor:
                 "money": [],
                 "error": str(e)
             }
+    
+    def extract_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract evidence from several independent texts.
+        
+        spaCy processes the texts in batches via nlp.pipe; the per-text
+        extraction (mostly regex scans) then runs in a thread pool.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            List of evidence dicts, one per text
+        """
+        if not texts:
+            return []
+        
+        workers = min(4, os.cpu_count() or 1)
+        
+        docs = [None] * len(texts)
+        if self.nlp:
+            try:
+                # Worker processes only pay off for larger batches
+                n_process = workers if len(texts) > 32 else 1
+                docs = list(self.nlp.pipe(texts, batch_size=32, n_process=n_process))
+            except Exception as e:
+                logger.error(f"Batch spaCy processing error: {str(e)}")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_evidence, texts, docs))
 
 
 # Global instance
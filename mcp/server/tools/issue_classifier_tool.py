@@ -15,10 +15,11 @@ Domains:
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 import torch
 from transformers import AutoTokenizer, AutoModel
 from model_loader import model_loader
+from legal_doc import LegalDoc
 import numpy as np
 
 # Configure logging
@@ -85,6 +86,13 @@ class IssueClassifier:
         ]
     }
     
+    # Keyword -> index into DOMAINS, so scoring is a single pass over all keywords
+    DOMAIN_KEYWORD_TO_INDEX = {
+        keyword: index
+        for index, keywords in enumerate(map(DOMAIN_KEYWORDS.get, DOMAINS))
+        for keyword in keywords
+    }
+    
     # Common legal issues
     COMMON_ISSUES = {
         "Criminal": [
@@ -118,10 +126,34 @@ class IssueClassifier:
         ]
     }
     
-    def __init__(self):
-        """Initialize the IssueClassifier."""
+    # Lowercased "/"-separated keywords of each common issue, split once
+    ISSUE_KEYWORDS = {
+        domain: [
+            (issue, tuple(keyword.strip() for keyword in issue.lower().split('/')))
+            for issue in issues
+        ]
+        for domain, issues in COMMON_ISSUES.items()
+    }
+    
+    MODEL_NAME = "law-ai/InLegalBERT"
+    
+    # Weight of keyword scores when blended with embedding similarity scores
+    EMBEDDING_BLEND_ALPHA = 0.7
+    # Softmax temperature turning centroid cosine similarities into scores
+    EMBEDDING_TEMPERATURE = 0.05
+    
+    def __init__(self, use_onnx: bool = True):
+        """
+        Initialize the IssueClassifier.
+        
+        Args:
+            use_onnx: Run embeddings through an int8 ONNX Runtime session when available
+        """
         self.model = None
         self.tokenizer = None
+        self.session = None
+        self.use_onnx = use_onnx
+        self.domain_centroids = None
         self.model_loaded = False
         
     def load_model(self):
@@ -132,10 +164,15 @@ class IssueClassifier:
         
         try:
             logger.info("Loading InLegalBERT model...")
-            self.tokenizer, self.model = model_loader.load_model("law-ai/InLegalBERT")
+            self.tokenizer, self.model = model_loader.load_model(self.MODEL_NAME)
             
             if self.tokenizer and self.model:
                 self.model.eval()  # Set to evaluation mode
+                if self.use_onnx:
+                    self.session = self._load_onnx_session()
+                    if self.session is not None:
+                        # The session serves all embeddings, so free the PyTorch weights
+                        self.model = None
                 self.model_loaded = True
                 logger.info("InLegalBERT model loaded successfully")
                 return True
@@ -147,6 +184,28 @@ class IssueClassifier:
             logger.error(f"Error loading model: {str(e)}")
             return False
     
+    def _load_onnx_session(self):
+        """
+        Create an ONNX Runtime session over the int8 quantized model.
+        
+        Returns:
+            InferenceSession or None (PyTorch is used as fallback)
+        """
+        try:
+            import onnxruntime as ort
+            
+            onnx_path = model_loader.export_quantized_onnx(self.MODEL_NAME, self.tokenizer, self.model)
+            if onnx_path is None:
+                return None
+            
+            session = ort.InferenceSession(str(onnx_path), providers=["CPUExecutionProvider"])
+            logger.info("Using int8 ONNX Runtime session for embeddings")
+            return session
+            
+        except Exception as e:
+            logger.warning(f"ONNX Runtime unavailable, using PyTorch: {str(e)}")
+            return None
+    
     def get_text_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         Get text embedding using InLegalBERT.
@@ -157,32 +216,103 @@ class IssueClassifier:
         Returns:
             Numpy array of embeddings or None
         """
+        embeddings = self.get_text_embeddings([text])
+        return embeddings[0] if embeddings is not None else None
+    
+    def get_text_embeddings(self, texts: List[str], batch_size: int = 32) -> Optional[np.ndarray]:
+        """
+        Get text embeddings for several texts with batched forward passes.
+        
+        Args:
+            texts: Input texts
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            Numpy array of shape (len(texts), hidden_size) or None
+        """
         if not self.model_loaded:
             if not self.load_model():
                 return None
         
         try:
-            # Tokenize
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512,
-                padding=True
-            )
-            
-            # Get embeddings
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                # Use CLS token embedding (first token)
-                embeddings = outputs.last_hidden_state[:, 0, :].numpy()
+            batches = []
+            for i in range(0, len(texts), batch_size):
+                batch = texts[i:i + batch_size]
+                
+                if self.session is not None:
+                    inputs = self.tokenizer(
+                        batch,
+                        return_tensors="np",
+                        truncation=True,
+                        max_length=512,
+                        padding=True
+                    )
+                    outputs = self.session.run(
+                        ["last_hidden_state"],
+                        {"input_ids": inputs["input_ids"], "attention_mask": inputs["attention_mask"]}
+                    )
+                    # Use CLS token embedding (first token)
+                    batches.append(outputs[0][:, 0, :])
+                    continue
+                
+                # Tokenize
+                inputs = self.tokenizer(
+                    batch,
+                    return_tensors="pt",
+                    truncation=True,
+                    max_length=512,
+                    padding=True
+                )
+                
+                # Get embeddings
+                with torch.no_grad():
+                    outputs = self.model(**inputs)
+                    # Use CLS token embedding (first token)
+                    batches.append(outputs.last_hidden_state[:, 0, :].numpy())
             
-            return embeddings[0]
+            return np.concatenate(batches, axis=0)
             
         except Exception as e:
             logger.error(f"Error getting embeddings: {str(e)}")
             return None
     
+    def get_domain_centroids(self) -> Optional[np.ndarray]:
+        """
+        Get unit-length embeddings of each domain's keyword list.
+        
+        Computed once on first use, in DOMAINS order.
+        
+        Returns:
+            Numpy array of shape (len(DOMAINS), hidden_size) or None
+        """
+        if self.domain_centroids is None:
+            texts = [", ".join(self.DOMAIN_KEYWORDS[domain]) for domain in self.DOMAINS]
+            embeddings = self.get_text_embeddings(texts)
+            if embeddings is not None:
+                self.domain_centroids = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        
+        return self.domain_centroids
+    
+    def embedding_based_classification(self, embedding: np.ndarray) -> Optional[Dict[str, float]]:
+        """
+        Classify a text embedding by cosine similarity to the domain centroids.
+        
+        Args:
+            embedding: Text embedding from get_text_embedding
+            
+        Returns:
+            Dict with domain scores summing to 1, or None
+        """
+        centroids = self.get_domain_centroids()
+        if centroids is None:
+            return None
+        
+        similarities = centroids @ (embedding / np.linalg.norm(embedding))
+        weights = np.exp((similarities - similarities.max()) / self.EMBEDDING_TEMPERATURE)
+        weights /= weights.sum()
+        
+        return {domain: float(w) for domain, w in zip(self.DOMAINS, weights)}
+    
     def keyword_based_classification(self, text: str) -> Dict[str, float]:
         """
         Classify text based on keyword matching.
@@ -194,12 +324,13 @@ class IssueClassifier:
             Dict with domain scores
         """
         text_lower = text.lower()
-        scores = {domain: 0.0 for domain in self.DOMAINS}
+        hits = [0.0] * len(self.DOMAINS)
+        
+        for keyword, index in self.DOMAIN_KEYWORD_TO_INDEX.items():
+            if keyword in text_lower:
+                hits[index] += 1.0
         
-        for domain, keywords in self.DOMAIN_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    scores[domain] += 1.0
+        scores = dict(zip(self.DOMAINS, hits))
         
         # Normalize scores
         total = sum(scores.values())
@@ -222,28 +353,37 @@ class IssueClassifier:
         text_lower = text.lower()
         identified_issues = []
         
-        if domain in self.COMMON_ISSUES:
-            for issue in self.COMMON_ISSUES[domain]:
-                # Check if issue keywords are in text
-                issue_keywords = issue.lower().split('/')
-                for keyword in issue_keywords:
-                    if keyword.strip() in text_lower:
-                        identified_issues.append(issue)
-                        break
+        for issue, issue_keywords in self.ISSUE_KEYWORDS.get(domain, ()):
+            # Check if issue keywords are in text
+            if any(keyword in text_lower for keyword in issue_keywords):
+                identified_issues.append(issue)
         
         return identified_issues
     
-    def classify(self, text: str, use_embeddings: bool = True) -> Dict[str, Any]:
+    def classify(
+        self,
+        text: Union[str, LegalDoc],
+        use_embeddings: bool = True,
+        embedding: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
         """
         Classify legal issues in text.
         
         Args:
-            text: Input text
+            text: Input text, or a shared LegalDoc whose cached embedding is reused
             use_embeddings: Whether to use model embeddings (slower but more accurate)
+            embedding: Optional precomputed embedding of the text
             
         Returns:
             Dict with classification results
         """
+        legal_doc = None
+        if isinstance(text, LegalDoc):
+            legal_doc = text
+            text = legal_doc.text
+            if embedding is None:
+                embedding = legal_doc.cls_embedding
+        
         try:
             logger.info(f"Classifying text: {text[:100]}...")
             
@@ -252,11 +392,24 @@ class IssueClassifier:
             
             # Get embedding-based scores if requested
             if use_embeddings:
-                embeddings = self.get_text_embedding(text)
+                embeddings = embedding if embedding is not None else self.get_text_embedding(text)
+                if legal_doc is not None:
+                    legal_doc.cls_embedding = embeddings
+                embedding_scores = None
                 if embeddings is not None:
-                    # For now, use keyword scores
-                    # In production, you'd train a classifier on top of embeddings
+                    embedding_scores = self.embedding_based_classification(embeddings)
+                
+                if embedding_scores is not None and not any(keyword_scores.values()):
+                    # Embedding similarities are relative (softmax) and always
+                    # pick some domain; without keyword evidence the text is
+                    # left "Unknown" rather than forced into one
                     domain_scores = keyword_scores
+                elif embedding_scores is not None:
+                    alpha = self.EMBEDDING_BLEND_ALPHA
+                    domain_scores = {
+                        domain: alpha * keyword_scores[domain] + (1 - alpha) * embedding_scores[domain]
+                        for domain in self.DOMAINS
+                    }
                 else:
                     logger.warning("Failed to get embeddings, using keyword-based classification")
                     domain_scores = keyword_scores
@@ -269,10 +422,11 @@ class IssueClassifier:
             # Primary domain (highest score)
             primary_domain = sorted_domains[0][0] if sorted_domains[0][1] > 0 else "Unknown"
             
-            # Secondary domains (score > 0.1)
+            # Secondary domains (score > 0.1, backed by at least one keyword
+            # hit so the embedding term alone cannot add one)
             secondary_domains = [
                 domain for domain, score in sorted_domains[1:] 
-                if score > 0.1
+                if score > 0.1 and keyword_scores[domain] > 0
             ]
             
             # Identify specific issues
@@ -308,6 +462,30 @@ class IssueClassifier:
                 "secondary_issues": [],
                 "error": str(e)
             }
+    
+    def classify_many(self, texts: List[str], use_embeddings: bool = True) -> List[Dict[str, Any]]:
+        """
+        Classify several texts, embedding them in batched forward passes.
+        
+        Args:
+            texts: Input texts
+            use_embeddings: Whether to use model embeddings
+            
+        Returns:
+            List of classification results, one per text
+        """
+        embeddings = None
+        if use_embeddings and texts:
+            embeddings = self.get_text_embeddings(texts)
+        
+        return [
+            self.classify(
+                text,
+                use_embeddings,
+                embedding=embeddings[i] if embeddings is not None else None
+            )
+            for i, text in enumerate(texts)
+        ]
 
 
 # Global instance
@@ -5,11 +5,23 @@ Applies law to facts using Google Gemini API with structured templates.
 Generates legal reasoning and analysis.
 """
 
+import io
 import os
+import json
+import random
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
-import google.generativeai as genai
+import string
+import threading
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, Union
+import diskcache
+import numpy as np
 from dotenv import load_dotenv
+from legal_doc import NormalizedSection, normalize_sections
 
 # Load environment variables
 load_dotenv()
@@ -18,43 +30,372 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Configure Gemini API
+# Gemini API key; the SDK itself is imported and configured on first use
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-    logger.info("Gemini API configured for legal analysis")
+    logger.info("Gemini API key found for legal analysis")
 else:
     logger.warning("GEMINI_API_KEY not found. Legal analysis features will be limited.")
 
+# Analysis caches live in the user cache directory unless LLM_CACHE_DIR is set
+LLM_CACHE_DIR = Path(
+    os.getenv("LLM_CACHE_DIR")
+    or Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "legal-case-analysis" / "llm_cache"
+)
+
+# Analysis prompt template, compiled once at import; each call is a single
+# substitute() with the pre-joined section and evidence blocks
+_PROMPT_TEMPLATE = string.Template("""You are a legal expert analyzing a case. Provide a detailed legal analysis applying the relevant laws to the facts.
+
+**Case Facts:**
+${facts}
+
+**Legal Domain:** ${domain}
+
+**Applicable Legal Sections:**
+${sections_text}
+${evidence_text}
+
+**Analysis Required:**
+
+1. **Elements of the Offense**: Identify which elements of each applicable section are satisfied by the facts.
+
+2. **Application of Law to Facts**: Explain how the facts meet the legal requirements of each section.
+
+3. **Strength of Case**: Assess the strength of the case based on available facts and evidence.
+
+4. **Potential Defenses**: Identify any potential defenses or counterarguments.
+
+5. **Conclusion**: Provide a reasoned conclusion about the applicability of the sections.
+
+Please provide a comprehensive legal analysis in clear, structured paragraphs. Use legal terminology appropriately and cite the relevant sections.""")
+
+# Returned by analyze_case when no Gemini API key is configured
+NO_API_RESULT = {
+    "analysis": "Legal analysis not available (Gemini API key not configured)",
+    "method": "no_api",
+    "error": "API key not configured"
+}
+
+
+@lru_cache(maxsize=None)
+def _retryable_gemini_errors() -> Tuple[type, ...]:
+    """Gemini errors worth retrying: throttling, unavailability and timeouts."""
+    from google.api_core import exceptions
+    
+    return (
+        exceptions.ResourceExhausted,
+        exceptions.ServiceUnavailable,
+        exceptions.DeadlineExceeded,
+        exceptions.InternalServerError,
+        asyncio.TimeoutError
+    )
+
+
+@lru_cache(maxsize=128)
+def _case_template(sections: Tuple[NormalizedSection, ...], domain: str) -> string.Template:
+    """
+    Prompt template with the domain and sections filled in.
+    
+    Memoized per (sections, domain), which repeat across cases and retries;
+    the facts and evidence are substituted per call and are not part of the key.
+    
+    Args:
+        sections: Normalized sections
+        domain: Legal domain
+        
+    Returns:
+        Template with the ${facts} and ${evidence_text} placeholders left
+    """
+    # Format sections
+    section_lines = []
+    for i, s in enumerate(sections, 1):
+        section_lines.append(f"\n{i}. **{s.act} Section {s.section}**: {s.title}\n")
+        section_lines.append(f"   Description: {s.description}\n")
+        if s.punishment:
+            section_lines.append(f"   Punishment: {s.punishment}\n")
+    
+    # Escape $ so section text survives the second substitution
+    return string.Template(_PROMPT_TEMPLATE.safe_substitute(
+        domain=domain.replace("$", "$$"),
+        sections_text="".join(section_lines).replace("$", "$$")
+    ))
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking call in the default executor (asyncio.to_thread needs Python 3.9)."""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+class LLMCache:
+    """Exact-match on-disk cache of Gemini analyses keyed by their inputs."""
+    
+    # Cached analyses expire after 7 days
+    TTL_SECONDS = 7 * 24 * 60 * 60
+    
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the LLMCache.
+        
+        Args:
+            cache_dir: Directory holding the cache database, opened on first use
+        """
+        self.cache_dir = cache_dir
+        self._cache: Optional[diskcache.Cache] = None
+        self._cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def cache(self) -> diskcache.Cache:
+        """Cache database, opened on the first lookup."""
+        if self._cache is None:
+            with self._cache_lock:
+                if self._cache is None:
+                    self._cache = diskcache.Cache(str(self.cache_dir))
+        return self._cache
+    
+    @staticmethod
+    def make_key(
+        facts: str,
+        sections: List[Dict[str, Any]],
+        domain: Optional[str],
+        evidence: Optional[Dict[str, Any]]
+    ) -> str:
+        """Build a deterministic key; section order does not matter."""
+        payload = {
+            "facts": facts,
+            "sections": sorted(sections, key=lambda s: (str(s.get("act")), str(s.get("section")))),
+            "domain": domain,
+            "evidence": evidence
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached analysis, counting hits and misses."""
+        value = self.cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    def set(self, key: str, analysis_text: str):
+        """Store an analysis."""
+        self.cache.set(key, analysis_text, expire=self.TTL_SECONDS)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.cache)}
+
+
+class SemanticCache:
+    """Near-duplicate cache of analyses matched by similarity of the facts."""
+    
+    MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+    DIMENSION = 384
+    # Minimum cosine similarity between facts to reuse an analysis
+    SIMILARITY_THRESHOLD = 0.92
+    # Write the index to disk after this many new entries
+    PERSIST_EVERY = 10
+    
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the SemanticCache. The embedding model and index load in
+        the background on first use.
+        
+        Args:
+            cache_dir: Directory holding the index and its metadata
+        """
+        self.index_path = cache_dir / "semantic_cache.faiss"
+        self.entries_path = cache_dir / "semantic_cache.json"
+        self.model = None
+        self.index = None
+        self.entries: List[Dict[str, str]] = []
+        self.unsaved = 0
+        self.lock = threading.Lock()
+        # Set once the dependencies or the model failed to load
+        self.unavailable = False
+        self._loader: Optional[threading.Thread] = None
+    
+    def _start_loading(self):
+        """Start loading the embedding model and index, once per cache."""
+        with self.lock:
+            if self._loader is None:
+                self._loader = threading.Thread(target=self._load, name="semantic-cache-loader", daemon=True)
+                self._loader.start()
+    
+    def _load(self):
+        """Load the embedding model and the persisted index."""
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+            
+            model = SentenceTransformer(self.MODEL_NAME)
+            index, entries = faiss.IndexFlatIP(self.DIMENSION), []
+            if self.index_path.exists() and self.entries_path.exists():
+                stored_index = faiss.read_index(str(self.index_path))
+                stored_entries = json.loads(self.entries_path.read_text(encoding='utf-8'))
+                if stored_index.ntotal == len(stored_entries):
+                    index, entries = stored_index, stored_entries
+                    logger.info(f"Loaded semantic cache with {len(entries)} entries")
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable: {str(e)}")
+            self.unavailable = True
+            return
+        
+        with self.lock:
+            self.index, self.entries = index, entries
+            # Publishing the model last marks the cache ready
+            self.model = model
+    
+    @staticmethod
+    def make_sections_key(sections: List[Dict[str, Any]], domain: Optional[str]) -> str:
+        """Identify the legal context an analysis was produced for."""
+        cited = sorted((str(s.get("act")), str(s.get("section"))) for s in sections)
+        return json.dumps({"domain": domain, "sections": cited})
+    
+    def encode(self, facts: str) -> Optional[np.ndarray]:
+        """
+        Embed the facts as a unit-length float32 row vector.
+        
+        Returns None while the model is still loading (the first call starts
+        loading it) and for good once it turned out to be unavailable.
+        """
+        if self.model is None:
+            if not self.unavailable:
+                self._start_loading()
+            return None
+        
+        try:
+            return self.model.encode([facts], normalize_embeddings=True).astype(np.float32)
+        except Exception as e:
+            logger.warning(f"Semantic cache encoding failed: {str(e)}")
+            return None
+    
+    def lookup(self, embedding: Optional[np.ndarray], sections_key: str) -> Optional[str]:
+        """Get the analysis of the most similar facts, if close enough."""
+        if embedding is None:
+            return None
+        
+        with self.lock:
+            if self.index.ntotal == 0:
+                return None
+            scores, ids = self.index.search(embedding, 1)
+            if scores[0, 0] <= self.SIMILARITY_THRESHOLD:
+                return None
+            entry = self.entries[ids[0, 0]]
+        
+        if entry["sections_key"] != sections_key:
+            return None
+        return entry["analysis"]
+    
+    def add(self, embedding: Optional[np.ndarray], sections_key: str, analysis_text: str):
+        """Store an analysis, persisting every PERSIST_EVERY additions."""
+        if embedding is None:
+            return
+        
+        with self.lock:
+            self.index.add(embedding)
+            self.entries.append({"analysis": analysis_text, "sections_key": sections_key})
+            self.unsaved += 1
+            if self.unsaved >= self.PERSIST_EVERY:
+                self._persist()
+    
+    def _persist(self):
+        """Write the index and its metadata to disk."""
+        import faiss
+        
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self.index, str(self.index_path))
+            self.entries_path.write_text(json.dumps(self.entries), encoding='utf-8')
+            self.unsaved = 0
+        except Exception as e:
+            logger.error(f"Error saving semantic cache: {str(e)}")
+
 
 class LegalAnalyzer:
     """Analyzes legal cases by applying law to facts using Gemini API."""
     
-    def __init__(self, gemini_api_key: Optional[str] = None):
+    MODEL_NAME = 'gemini-flash-latest'
+    
+    # Evidence items listed in the prompt, per kind
+    MAX_WITNESSES = 10
+    MAX_DOCUMENTS = 3
+    MAX_DATES = 2
+    MAX_LOCATIONS = 2
+    
+    # Async Gemini requests: per-attempt timeout and retry budget
+    REQUEST_TIMEOUT_SECONDS = 60
+    MAX_ATTEMPTS = 4
+    MAX_BACKOFF_SECONDS = 20
+    
+    # One model per process so every analysis reuses the SDK's open gRPC
+    # (HTTP/2) channel instead of dialing and handshaking again
+    _shared_model = None
+    _configured_api_key = None
+    _model_lock = threading.Lock()
+    
+    def __init__(self, gemini_api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         """
         Initialize the LegalAnalyzer.
         
         Args:
             gemini_api_key: Optional Gemini API key
+            cache_dir: Directory for the analysis cache (default: LLM_CACHE_DIR)
         """
-        if gemini_api_key:
-            genai.configure(api_key=gemini_api_key)
-            self.has_api = True
-        else:
-            self.has_api = bool(GEMINI_API_KEY)
+        if cache_dir is None:
+            cache_dir = LLM_CACHE_DIR
         
-        if self.has_api:
-            try:
-                self.model = genai.GenerativeModel('gemini-flash-latest')
+        self.cache = LLMCache(Path(cache_dir))
+        self.semantic_cache = SemanticCache(Path(cache_dir))
+        
+        self.gemini_api_key = gemini_api_key
+        self.has_api = bool(gemini_api_key or GEMINI_API_KEY)
+    
+    @property
+    def model(self):
+        """Shared Gemini model, imported and created on the first analysis."""
+        return self._get_shared_model(self.gemini_api_key)
+    
+    @classmethod
+    def _get_shared_model(cls, gemini_api_key: Optional[str] = None):
+        """
+        Get the process-wide Gemini model, creating it on first use.
+        
+        Args:
+            gemini_api_key: Optional API key (default: GEMINI_API_KEY); the
+                SDK is only reconfigured when it differs from the current
+                one, because configuring discards the SDK's cached clients
+                and their connections
+            
+        Returns:
+            Shared GenerativeModel
+        """
+        with cls._model_lock:
+            api_key = gemini_api_key or cls._configured_api_key or GEMINI_API_KEY
+            if api_key != cls._configured_api_key:
+                import google.generativeai as genai
+                genai.configure(api_key=api_key)
+                cls._configured_api_key = api_key
+                cls._shared_model = None
+            
+            if cls._shared_model is None:
+                import google.generativeai as genai
+                # Deterministic output so cached analyses stay valid
+                cls._shared_model = genai.GenerativeModel(
+                    cls.MODEL_NAME,
+                    generation_config={"temperature": 0}
+                )
                 logger.info("Gemini model initialized for legal analysis")
-            except Exception as e:
-                logger.error(f"Error initializing Gemini model: {str(e)}")
-                self.has_api = False
+            
+            return cls._shared_model
     
     def generate_analysis_prompt(
         self,
         facts: str,
-        sections: List[Dict[str, Any]],
+        sections: List[Union[Dict[str, Any], NormalizedSection]],
         domain: Optional[str] = None,
         evidence: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -63,84 +404,181 @@ class LegalAnalyzer:
         
         Args:
             facts: Case facts
-            sections: Relevant legal sections
+            sections: Relevant legal sections (dicts or NormalizedSection)
             domain: Legal domain
             evidence: Extracted evidence
             
         Returns:
             Formatted prompt
         """
-        prompt = """You are a legal expert analyzing a case. Provide a detailed legal analysis applying the relevant laws to the facts.
-
-**Case Facts:**
-{facts}
-
-**Legal Domain:** {domain}
-
-**Applicable Legal Sections:**
-{sections_text}
-"""
+        return self._build_prompt(
+            facts,
+            normalize_sections(sections),
+            domain or "Not specified",
+            self._evidence_items(evidence)
+        )
+    
+    def _evidence_items(self, evidence: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Reduce evidence to the capped lists the prompt shows.
         
-        # Format sections
-        sections_text = ""
-        for i, section in enumerate(sections, 1):
-            act = section.get("act", "Unknown")
-            section_num = section.get("section", "N/A")
-            title = section.get("title", "")
-            description = section.get("description", "")
-            punishment = section.get("punishment", "")
-            
-            sections_text += f"\n{i}. **{act} Section {section_num}**: {title}\n"
-            sections_text += f"   Description: {description}\n"
-            if punishment:
-                sections_text += f"   Punishment: {punishment}\n"
+        Returns:
+            (witnesses, documents, dates, locations), or () without evidence
+        """
+        if not evidence:
+            return ()
+        
+        # islice stops reading each list as soon as the cap is reached
+        return (
+            tuple(islice(
+                (w["name"] for w in evidence.get("witnesses") or () if w.get("is_witness")),
+                self.MAX_WITNESSES
+            )),
+            tuple(d["reference"] for d in islice(evidence.get("documents") or (), self.MAX_DOCUMENTS)),
+            tuple(d["date"] for d in islice(evidence.get("dates") or (), self.MAX_DATES)),
+            tuple(l["location"] for l in islice(evidence.get("locations") or (), self.MAX_LOCATIONS))
+        )
+    
+    @staticmethod
+    def _build_prompt(
+        facts: str,
+        sections: List[NormalizedSection],
+        domain: str,
+        evidence_items: Tuple[Tuple[str, ...], ...]
+    ) -> str:
+        """Assemble the prompt from normalized sections and evidence items."""
+        try:
+            template = _case_template(tuple(sections), domain)
+        except TypeError:
+            # Section values that cannot be hashed (e.g. lists) skip the memo
+            template = _case_template.__wrapped__(tuple(sections), domain)
         
         # Add evidence if available
-        if evidence:
-            evidence_text = "\n**Evidence Available:**\n"
-            if evidence.get("witnesses"):
-                witnesses = [w["name"] for w in evidence["witnesses"] if w.get("is_witness")]
-                if witnesses:
-                    evidence_text += f"- Witnesses: {', '.join(witnesses)}\n"
-            
-            if evidence.get("documents"):
-                docs = [d["reference"] for d in evidence["documents"][:3]]
-                if docs:
-                    evidence_text += f"- Documents: {', '.join(docs)}\n"
-            
-            if evidence.get("dates"):
-                dates = [d["date"] for d in evidence["dates"][:2]]
-                if dates:
-                    evidence_text += f"- Dates: {', '.join(dates)}\n"
-            
-            if evidence.get("locations"):
-                locations = [l["location"] for l in evidence["locations"][:2]]
-                if locations:
-                    evidence_text += f"- Locations: {', '.join(locations)}\n"
+        evidence_lines = []
+        if evidence_items:
+            evidence_lines.append("\n**Evidence Available:**\n")
+            for label, items in zip(("Witnesses", "Documents", "Dates", "Locations"), evidence_items):
+                if items:
+                    evidence_lines.append(f"- {label}: {', '.join(items)}\n")
+        
+        return template.substitute(facts=facts, evidence_text="".join(evidence_lines))
+    
+    def _lookup_cached_analysis(
+        self,
+        facts: str,
+        sections: List[Dict[str, Any]],
+        domain: Optional[str],
+        evidence: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Look up the exact-match cache, then the semantic cache.
+        
+        Returns:
+            Dict with "analysis" (None on a miss), "method", and the keys
+            needed by _store_analysis
+        """
+        lookup = {"cache_key": self.cache.make_key(facts, sections, domain, evidence)}
+        lookup["analysis"] = self.cache.get(lookup["cache_key"])
+        lookup["method"] = "llm_cache"
+        
+        # Fall back to an analysis of paraphrased facts under the same sections
+        if lookup["analysis"] is None:
+            lookup["sections_key"] = self.semantic_cache.make_sections_key(sections, domain)
+            lookup["facts_embedding"] = self.semantic_cache.encode(facts)
+            lookup["analysis"] = self.semantic_cache.lookup(lookup["facts_embedding"], lookup["sections_key"])
+            lookup["method"] = "semantic_cache"
+        
+        return lookup
+    
+    def _store_analysis(self, lookup: Dict[str, Any], analysis_text: str):
+        """Add a fresh analysis to both caches."""
+        self.cache.set(lookup["cache_key"], analysis_text)
+        self.semantic_cache.add(lookup["facts_embedding"], lookup["sections_key"], analysis_text)
+    
+    def _start_analysis(
+        self,
+        facts: str,
+        sections: List[Dict[str, Any]],
+        domain: Optional[str],
+        evidence: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Shared first step of every analysis: cache lookup, then the prompt.
+        
+        Returns:
+            The cache lookup, plus "normalized" sections and the Gemini
+            "prompt" (None when a cached analysis was found)
+        """
+        lookup = self._lookup_cached_analysis(facts, sections, domain, evidence)
+        lookup["normalized"] = normalize_sections(sections)
+        lookup["prompt"] = None
+        
+        if lookup["analysis"] is not None:
+            logger.info(f"Using cached analysis ({lookup['method']})")
+        else:
+            lookup["prompt"] = self.generate_analysis_prompt(facts, lookup["normalized"], domain, evidence)
+        
+        return lookup
+    
+    def _finish_analysis(
+        self,
+        lookup: Dict[str, Any],
+        analysis_text: Optional[str],
+        facts: str,
+        domain: Optional[str],
+        evidence: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Shared last step: cache a fresh Gemini analysis and build the result.
+        
+        Args:
+            lookup: Result of _start_analysis
+            analysis_text: Gemini's analysis, or None when lookup had a cached one
+            facts: Case facts
+            domain: Legal domain
+            evidence: Extracted evidence
             
-            prompt += evidence_text
+        Returns:
+            Dict with analysis results
+        """
+        method = lookup["method"]
+        if analysis_text is None:
+            analysis_text = lookup["analysis"]
+        else:
+            self._store_analysis(lookup, analysis_text)
+            method = "gemini_api"
+            logger.info(f"Analysis generated ({len(analysis_text)} chars)")
         
-        prompt += """
-
-**Analysis Required:**
-
-1. **Elements of the Offense**: Identify which elements of each applicable section are satisfied by the facts.
-
-2. **Application of Law to Facts**: Explain how the facts meet the legal requirements of each section.
-
-3. **Strength of Case**: Assess the strength of the case based on available facts and evidence.
-
-4. **Potential Defenses**: Identify any potential defenses or counterarguments.
-
-5. **Conclusion**: Provide a reasoned conclusion about the applicability of the sections.
-
-Please provide a comprehensive legal analysis in clear, structured paragraphs. Use legal terminology appropriately and cite the relevant sections."""
+        result = {
+            "analysis": analysis_text,
+            "method": method,
+            "domain": domain,
+            "sections_analyzed": len(lookup["normalized"]),
+            "facts_length": len(facts),
+            "has_evidence": evidence is not None
+        }
         
-        return prompt.format(
-            facts=facts,
-            domain=domain or "Not specified",
-            sections_text=sections_text
-        )
+        # Add section summary
+        result["sections_summary"] = [
+            {
+                "act": s.act,
+                "section": s.section,
+                "title": s.title
+            }
+            for s in lookup["normalized"]
+        ]
+        
+        return result
+    
+    @staticmethod
+    def _error_result(error: Exception) -> Dict[str, Any]:
+        """Result returned when an analysis fails."""
+        logger.error(f"Legal analysis error: {str(error)}")
+        return {
+            "analysis": f"Error during analysis: {str(error)}",
+            "method": "error",
+            "error": str(error)
+        }
     
     def analyze_case(
         self,
@@ -162,54 +600,161 @@ Please provide a comprehensive legal analysis in clear, structured paragraphs. U
             Dict with analysis results
         """
         if not self.has_api:
-            return {
-                "analysis": "Legal analysis not available (Gemini API key not configured)",
-                "method": "no_api",
-                "error": "API key not configured"
-            }
+            return NO_API_RESULT.copy()
         
         try:
             logger.info(f"Analyzing case with {len(sections)} sections")
+            lookup = self._start_analysis(facts, sections, domain, evidence)
             
-            # Generate prompt
-            prompt = self.generate_analysis_prompt(facts, sections, domain, evidence)
+            analysis_text = None
+            if lookup["prompt"] is not None:
+                logger.info("Requesting analysis from Gemini API...")
+                analysis_text = self.model.generate_content(lookup["prompt"]).text.strip()
             
-            # Get analysis from Gemini
-            logger.info("Requesting analysis from Gemini API...")
-            response = self.model.generate_content(prompt)
-            analysis_text = response.text.strip()
+            return self._finish_analysis(lookup, analysis_text, facts, domain, evidence)
             
-            logger.info(f"Analysis generated ({len(analysis_text)} chars)")
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def analyze_case_async(
+        self,
+        facts: str,
+        sections: List[Dict[str, Any]],
+        domain: Optional[str] = None,
+        evidence: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze a legal case without blocking the event loop.
+        
+        Same as analyze_case, but awaits the Gemini call so concurrent
+        analyses overlap their API waits.
+        
+        Args:
+            facts: Case facts
+            sections: Relevant legal sections
+            domain: Legal domain
+            evidence: Extracted evidence
             
-            # Structure the result
-            result = {
-                "analysis": analysis_text,
-                "method": "gemini_api",
-                "domain": domain,
-                "sections_analyzed": len(sections),
-                "facts_length": len(facts),
-                "has_evidence": evidence is not None
-            }
+        Returns:
+            Dict with analysis results
+        """
+        if not self.has_api:
+            return NO_API_RESULT.copy()
+        
+        try:
+            logger.info(f"Analyzing case with {len(sections)} sections")
+            # Cache lookups embed the facts and touch disk, so keep them off the loop
+            lookup = await _run_blocking(self._start_analysis, facts, sections, domain, evidence)
             
-            # Add section summary
-            result["sections_summary"] = [
-                {
-                    "act": s.get("act"),
-                    "section": s.get("section"),
-                    "title": s.get("title")
-                }
-                for s in sections
-            ]
+            analysis_text = None
+            if lookup["prompt"] is not None:
+                logger.info("Requesting analysis from Gemini API...")
+                analysis_text = await self._generate_async(lookup["prompt"])
             
-            return result
+            return await _run_blocking(self._finish_analysis, lookup, analysis_text, facts, domain, evidence)
+            
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def _generate_async(self, prompt: str) -> str:
+        """
+        Request an analysis from Gemini, retrying transient failures.
+        
+        Each attempt is capped at REQUEST_TIMEOUT_SECONDS. Throttling,
+        unavailability and timeouts are retried up to MAX_ATTEMPTS times with
+        jittered exponential backoff; other errors are raised immediately.
+        
+        Args:
+            prompt: Analysis prompt
+            
+        Returns:
+            Analysis text
+        """
+        retryable = _retryable_gemini_errors()
+        
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                response = await asyncio.wait_for(
+                    self.model.generate_content_async(prompt),
+                    self.REQUEST_TIMEOUT_SECONDS
+                )
+                return response.text.strip()
+            except retryable as e:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                delay = min(2 ** attempt + random.random(), self.MAX_BACKOFF_SECONDS)
+                logger.warning(
+                    f"Gemini request failed ({type(e).__name__}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.MAX_ATTEMPTS})"
+                )
+                await asyncio.sleep(delay)
+    
+    async def stream_analysis_async(
+        self,
+        facts: str,
+        sections: List[Dict[str, Any]],
+        domain: Optional[str] = None,
+        evidence: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a legal analysis while Gemini is still generating it.
+        
+        Cached analyses are yielded whole. Otherwise the response is requested
+        with stream=True and every chunk is yielded as soon as it arrives; the
+        complete text is cached once the stream ends.
+        
+        Args:
+            facts: Case facts
+            sections: Relevant legal sections
+            domain: Legal domain
+            evidence: Extracted evidence
+            
+        Yields:
+            Analysis text chunks
+        """
+        if not self.has_api:
+            yield NO_API_RESULT["analysis"]
+            return
+        
+        try:
+            logger.info(f"Streaming analysis of case with {len(sections)} sections")
+            
+            lookup = await _run_blocking(self._start_analysis, facts, sections, domain, evidence)
+            if lookup["prompt"] is None:
+                yield lookup["analysis"]
+                return
+            
+            logger.info("Streaming analysis from Gemini API...")
+            response = await asyncio.wait_for(
+                self.model.generate_content_async(lookup["prompt"], stream=True),
+                self.REQUEST_TIMEOUT_SECONDS
+            )
+            chunks = []
+            async for chunk in response:
+                chunks.append(chunk.text)
+                yield chunk.text
+            
+            analysis_text = "".join(chunks).strip()
+            await _run_blocking(self._store_analysis, lookup, analysis_text)
+            logger.info(f"Analysis streamed ({len(analysis_text)} chars)")
             
         except Exception as e:
             logger.error(f"Legal analysis error: {str(e)}")
-            return {
-                "analysis": f"Error during analysis: {str(e)}",
-                "method": "error",
-                "error": str(e)
-            }
+            yield f"\n\nError during analysis: {str(e)}"
+    
+    async def analyze_many(self, cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several cases concurrently.
+        
+        Args:
+            cases: Dicts with analyze_case arguments (facts, sections, domain, evidence)
+            
+        Returns:
+            List of analysis results, in the order of cases
+        """
+        return list(await asyncio.gather(
+            *(self.analyze_case_async(**case) for case in cases)
+        ))
     
     def generate_template_analysis(
         self,
@@ -228,38 +773,33 @@ Please provide a comprehensive legal analysis in clear, structured paragraphs. U
         Returns:
             Template-based analysis text
         """
-        analysis = f"# Legal Analysis\n\n"
-        analysis += f"**Domain:** {domain or 'Not specified'}\n\n"
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# Legal Analysis\n\n")
+        write(f"**Domain:** {domain or 'Not specified'}\n\n")
         
-        analysis += f"## Case Facts\n{facts}\n\n"
+        write(f"## Case Facts\n{facts}\n\n")
         
-        analysis += f"## Applicable Legal Sections\n\n"
-        for section in sections:
-            act = section.get("act", "Unknown")
-            section_num = section.get("section", "N/A")
-            title = section.get("title", "")
-            punishment = section.get("punishment", "")
-            
-            analysis += f"### {act} Section {section_num}: {title}\n"
-            if punishment:
-                analysis += f"**Punishment:** {punishment}\n"
-            analysis += "\n"
-        
-        analysis += f"## Analysis\n\n"
-        analysis += f"Based on the facts presented, the following sections may be applicable:\n\n"
-        
-        for i, section in enumerate(sections, 1):
-            act = section.get("act", "Unknown")
-            section_num = section.get("section", "N/A")
-            title = section.get("title", "")
-            
-            analysis += f"{i}. **{act} Section {section_num}** ({title}): "
-            analysis += f"The facts suggest potential applicability of this section. "
-            analysis += f"Further investigation and legal consultation is recommended.\n\n"
+        normalized = normalize_sections(sections)
+        
+        write(f"## Applicable Legal Sections\n\n")
+        for s in normalized:
+            write(f"### {s.act} Section {s.section}: {s.title}\n")
+            if s.punishment:
+                write(f"**Punishment:** {s.punishment}\n")
+            write("\n")
+        
+        write(f"## Analysis\n\n")
+        write(f"Based on the facts presented, the following sections may be applicable:\n\n")
+        
+        for i, s in enumerate(normalized, 1):
+            write(f"{i}. **{s.act} Section {s.section}** ({s.title}): ")
+            write(f"The facts suggest potential applicability of this section. ")
+            write(f"Further investigation and legal consultation is recommended.\n\n")
         
-        analysis += "**Note:** This is a template-based analysis. For detailed legal reasoning, please configure the Gemini API key.\n"
+        write("**Note:** This is a template-based analysis. For detailed legal reasoning, please configure the Gemini API key.\n")
         
-        return analysis
+        return buf.getvalue()
 
 
 # Global instance
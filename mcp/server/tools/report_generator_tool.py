@@ -4,24 +4,151 @@ Report Generator Tool for Legal Case Analysis
 Generates comprehensive case analysis reports in markdown and PDF formats.
 """
 
+import io
 import os
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from contextlib import nullcontext
+from typing import Dict, Any, Iterator, List, Optional, TextIO, Tuple
 from datetime import datetime
 from pathlib import Path
-import markdown2
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER
-from reportlab.lib import colors
+from functools import lru_cache
+from types import SimpleNamespace
 import re
+from legal_doc import normalize_sections
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Markdown **bold** to ReportLab <b> markup
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_BOLD_SUB = _BOLD_RE.sub
+
+
+@lru_cache(maxsize=None)
+def _pdf_kit() -> SimpleNamespace:
+    """
+    Import ReportLab and build the shared PDF styles on first use.
+    
+    ReportLab is only needed when a PDF is rendered, so it stays out of
+    module import. Only classes and the stylesheet are shared: flowables
+    are marked by the layout engine while a document is built, so every
+    one (spacers included) is created per use.
+    
+    Returns:
+        Namespace with the ReportLab classes and styles in use
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_JUSTIFY
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    
+    styles = getSampleStyleSheet()
+    styles['Normal'].alignment = TA_JUSTIFY
+    styles.add(ParagraphStyle(name='Justify', alignment=TA_JUSTIFY, parent=styles['Normal']))
+    
+    return SimpleNamespace(
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        inch=inch,
+        Table=Table,
+        TableStyle=TableStyle,
+        SimpleDocTemplate=SimpleDocTemplate,
+        colors=colors,
+        pagesize=A4,
+        # Usable frame width on A4 with 72pt margins on each side
+        available_width=A4[0] - 144,
+        styles=styles,
+    )
+
+
+def _spacer(height: float) -> Any:
+    """New vertical spacer of height inches."""
+    pdf = _pdf_kit()
+    return pdf.Spacer(1, height*pdf.inch)
+
+
+def _add_title(text: str, elements: List[Any]) -> None:
+    """Render a top-level heading."""
+    pdf = _pdf_kit()
+    elements.append(_spacer(0.2))
+    elements.append(pdf.Paragraph(text.strip(), pdf.styles['Title']))
+    elements.append(_spacer(0.2))
+
+
+def _add_heading2(text: str, elements: List[Any]) -> None:
+    """Render a section heading (Heading1 is too large for section titles)."""
+    pdf = _pdf_kit()
+    elements.append(_spacer(0.2))
+    elements.append(pdf.Paragraph(text.strip(), pdf.styles['Heading2']))
+    elements.append(_spacer(0.1))
+
+
+def _add_heading3(text: str, elements: List[Any]) -> None:
+    """Render a sub-section heading."""
+    pdf = _pdf_kit()
+    elements.append(_spacer(0.1))
+    elements.append(pdf.Paragraph(text.strip(), pdf.styles['Heading3']))
+    elements.append(_spacer(0.05))
+
+
+def _add_list_item(text: str, elements: List[Any]) -> None:
+    """Render a bullet list item, keeping inline bold."""
+    pdf = _pdf_kit()
+    text = _BOLD_SUB(r'<b>\1</b>', f"• {text}")
+    elements.append(pdf.Paragraph(text, pdf.styles['Normal'], bulletText='•'))
+
+
+def _add_paragraph(text: str, elements: List[Any]) -> None:
+    """Render a paragraph; a line wrapped entirely in ** becomes a bold line."""
+    pdf = _pdf_kit()
+    if text.startswith('**') and text.endswith('**'):
+        text = f"<b>{text[2:-2]}</b>"
+    else:
+        text = _BOLD_SUB(r'<b>\1</b>', text)
+    elements.append(pdf.Paragraph(text, pdf.styles['Normal']))
+    # Small space after paragraph
+    elements.append(_spacer(0.1))
+
+
+# Markdown line prefix -> flowable builder for the text after the prefix
+_LINE_HANDLERS = {
+    '# ': _add_title,
+    '## ': _add_heading2,
+    '### ': _add_heading3,
+    '- ': _add_list_item,
+    '* ': _add_list_item,
+}
+
+# Report block kind -> flowable builder ("list" and "markdown" blocks are
+# expanded by ReportGenerator itself)
+_BLOCK_HANDLERS = {
+    'h1': _add_title,
+    'h2': _add_heading2,
+    'h3': _add_heading3,
+    'para': _add_paragraph,
+    'line': _add_paragraph,
+}
+
+# Report block kind -> markdown rendering; "line" ends in a hard line break
+_MARKDOWN_FORMATS = {
+    'h1': "# {}\n\n",
+    'h2': "## {}\n\n",
+    'h3': "### {}\n\n",
+    'para': "{}\n\n",
+    'line': "{}  \n",
+    'markdown': "{}\n\n",
+}
+
+_DISCLAIMER = (
+    "This report is generated by an AI-powered legal analysis system and is intended for "
+    "informational purposes only. It should not be considered as legal advice. Please consult "
+    "with a qualified legal professional for specific legal guidance."
+)
+
 
 class ReportGenerator:
     """Generates case analysis reports in markdown and PDF formats."""
@@ -41,159 +168,162 @@ class ReportGenerator:
         self.documents_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Report generator initialized. Documents dir: {self.documents_dir}")
     
-    def generate_markdown_report(
+    def _iter_report_sections(
         self,
         case_id: str,
         case_data: Dict[str, Any]
-    ) -> str:
+    ) -> Iterator[Tuple[str, Any]]:
         """
-        Generate markdown report from case data.
+        Yield the report as typed blocks shared by the markdown and PDF writers.
+        
+        Args:
+            case_id: Case identifier
+            case_data: Case analysis results
+            
+        Yields:
+            (kind, payload) tuples: "h1"/"h2"/"h3"/"para"/"line" with a text
+            payload, "list" with a list of item texts, and "markdown" with
+            free-form markdown (case facts, LLM analysis) rendered line by line
         """
         # Extract data
         facts = case_data.get("facts", "No facts provided")
         domain = case_data.get("domain", "Not specified")
         primary_issue = case_data.get("primary_issue", "Not identified")
-        sections = case_data.get("sections", [])
+        sections = normalize_sections(case_data.get("sections", []))
         evidence = case_data.get("evidence", {})
         analysis = case_data.get("analysis", "No analysis available")
         
-        # Generate report
-        report = f"""# Legal Case Analysis Report
-
-**Case ID:** {case_id}  
-**Generated:** {datetime.now().strftime("%B %d, %Y at %I:%M %p")}  
-**Domain:** {domain}  
-**Primary Issue:** {primary_issue}
-
-## 1. Case Facts
-
-{facts}
-
-## 2. Legal Classification
-
-**Domain:** {domain}  
-**Primary Issue:** {primary_issue}
-
-"""
+        yield ("h1", "Legal Case Analysis Report")
+        yield ("line", f"**Case ID:** {case_id}")
+        yield ("line", f"**Generated:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
+        yield ("line", f"**Domain:** {domain}")
+        yield ("para", f"**Primary Issue:** {primary_issue}")
+        
+        yield ("h2", "1. Case Facts")
+        yield ("markdown", facts)
+        
+        yield ("h2", "2. Legal Classification")
+        yield ("line", f"**Domain:** {domain}")
+        yield ("para", f"**Primary Issue:** {primary_issue}")
         
         if case_data.get("secondary_issues"):
-            report += f"**Secondary Issues:** {', '.join(case_data['secondary_issues'])}\n"
+            yield ("para", f"**Secondary Issues:** {', '.join(case_data['secondary_issues'])}")
         
-        report += "\n## 3. Applicable Legal Sections\n\n"
+        yield ("h2", "3. Applicable Legal Sections")
         
         if sections:
-            for i, section in enumerate(sections, 1):
-                act = section.get("act", "Unknown")
-                section_num = section.get("section", "N/A")
-                title = section.get("title", "")
-                description = section.get("description", "")
-                punishment = section.get("punishment", "")
-                bailable = section.get("bailable")
-                cognizable = section.get("cognizable")
-                
-                report += f"### {i}. {act} Section {section_num}\n\n"
-                report += f"**Title:** {title}\n\n"
-                report += f"**Description:** {description}\n\n"
+            for i, s in enumerate(sections, 1):
+                yield ("h3", f"{i}. {s.act} Section {s.section}")
+                yield ("para", f"**Title:** {s.title}")
+                yield ("para", f"**Description:** {s.description}")
                 
-                if punishment:
-                    report += f"**Punishment:** {punishment}\n\n"
+                if s.punishment:
+                    yield ("para", f"**Punishment:** {s.punishment}")
                 
-                if bailable is not None:
-                    report += f"**Bailable:** {'Yes' if bailable else 'No'}  \n"
+                if s.bailable is not None:
+                    yield ("line", f"**Bailable:** {'Yes' if s.bailable else 'No'}")
                 
-                if cognizable is not None:
-                    report += f"**Cognizable:** {'Yes' if cognizable else 'No'}\n\n"
+                if s.cognizable is not None:
+                    yield ("para", f"**Cognizable:** {'Yes' if s.cognizable else 'No'}")
         else:
-            report += "No sections identified.\n\n"
+            yield ("para", "No sections identified.")
         
-        report += "## 4. Evidence Summary\n\n"
+        yield ("h2", "4. Evidence Summary")
         
         if evidence:
             witnesses = evidence.get("witnesses", [])
             if witnesses:
                 confirmed = [w for w in witnesses if w.get("is_witness")]
-                report += f"### Witnesses ({len(confirmed)} confirmed)\n\n"
-                for w in confirmed:
-                    report += f"- **{w['name']}** ({w.get('type', 'witness')})\n"
-                report += "\n"
+                yield ("h3", f"Witnesses ({len(confirmed)} confirmed)")
+                yield ("list", [f"**{w['name']}** ({w.get('type', 'witness')})" for w in confirmed])
             
             documents = evidence.get("documents", [])
             if documents:
-                report += f"### Documents ({len(documents)})\n\n"
-                for d in documents[:5]:
-                    report += f"- {d['reference']}\n"
-                report += "\n"
+                yield ("h3", f"Documents ({len(documents)})")
+                yield ("list", [d['reference'] for d in documents[:5]])
             
             dates = evidence.get("dates", [])
             if dates:
-                report += f"### Important Dates\n\n"
-                for d in dates[:5]:
-                    report += f"- {d['date']}\n"
-                report += "\n"
+                yield ("h3", "Important Dates")
+                yield ("list", [d['date'] for d in dates[:5]])
             
             locations = evidence.get("locations", [])
             if locations:
-                report += f"### Locations\n\n"
-                for l in locations[:5]:
-                    report += f"- {l['location']}\n"
-                report += "\n"
+                yield ("h3", "Locations")
+                yield ("list", [l['location'] for l in locations[:5]])
                 
             money = evidence.get("money", [])
             if money:
-                report += f"### Monetary Amounts\n\n"
-                for m in money:
-                    report += f"- {m['amount']}\n"
-                report += "\n"
+                yield ("h3", "Monetary Amounts")
+                yield ("list", [m['amount'] for m in money])
         else:
-            report += "No evidence extracted.\n\n"
+            yield ("para", "No evidence extracted.")
         
-        report += "## 5. Legal Analysis\n\n"
-        report += f"{analysis}\n\n"
+        yield ("h2", "5. Legal Analysis")
+        yield ("markdown", analysis)
         
-        report += "## 6. Conclusion\n\n"
+        yield ("h2", "6. Conclusion")
         
         if sections:
-            report += f"Based on the facts and evidence presented, the case falls under the domain of **{domain}** law. "
-            report += f"The primary issue identified is **{primary_issue}**. "
-            report += f"\n\n{len(sections)} relevant legal section(s) have been identified:\n\n"
-            for section in sections:
-                report += f"- {section.get('act')} Section {section.get('section')}\n"
-            report += "\n"
+            yield ("para",
+                   f"Based on the facts and evidence presented, the case falls under the domain of **{domain}** law. "
+                   f"The primary issue identified is **{primary_issue}**.")
+            yield ("para", f"{len(sections)} relevant legal section(s) have been identified:")
+            yield ("list", [f"{s.act} Section {s.section}" for s in sections])
         else:
-            report += "Further investigation is required to identify applicable legal sections.\n\n"
+            yield ("para", "Further investigation is required to identify applicable legal sections.")
         
-        report += """
-## Disclaimer
-
-This report is generated by an AI-powered legal analysis system and is intended for informational purposes only. It should not be considered as legal advice. Please consult with a qualified legal professional for specific legal guidance.
-
-*Report generated by AI-Based Legal Case Classification & Analysis System*
-"""
-        return report
+        yield ("h2", "Disclaimer")
+        yield ("para", _DISCLAIMER)
+        yield ("para", "*Report generated by AI-Based Legal Case Classification & Analysis System*")
+    
+    @staticmethod
+    def _write_markdown_block(block: Tuple[str, Any], out: TextIO) -> None:
+        """Write one report block to a markdown stream."""
+        kind, payload = block
+        if kind == "list":
+            for item in payload:
+                out.write(f"- {item}\n")
+            out.write("\n")
+        else:
+            out.write(_MARKDOWN_FORMATS[kind].format(payload))
+    
+    def _append_block_flowables(self, block: Tuple[str, Any], elements: List[Any]) -> None:
+        """Append the ReportLab flowables for one report block."""
+        kind, payload = block
+        if kind == "list":
+            for item in payload:
+                _add_list_item(item, elements)
+        elif kind == "markdown":
+            self._append_markdown_flowables(payload, elements)
+        else:
+            _BLOCK_HANDLERS[kind](payload, elements)
+    
+    def generate_markdown_report(
+        self,
+        case_id: str,
+        case_data: Dict[str, Any]
+    ) -> str:
+        """
+        Generate markdown report from case data.
+        """
+        buf = io.StringIO()
+        for block in self._iter_report_sections(case_id, case_data):
+            self._write_markdown_block(block, buf)
+        return buf.getvalue()
 
     def _process_table(self, buffer, elements, styles, available_width):
         """Helper to process and render a table from markdown lines."""
-        data = []
-        for row_str in buffer:
-            # Clean split by pipe
-            # | A | B | -> ["", "A", "B", ""] -> ["A", "B"]
-            cells = [c.strip() for c in row_str.split('|')]
-            # Remove empty first/last if they exist
-            if len(cells) > 0 and cells[0] == '': cells.pop(0)
-            if len(cells) > 0 and cells[-1] == '': cells.pop(-1)
-            
-            if not cells: continue
-            
-            # Skip delimiter row
-            if '---' in cells[0]: continue
-            
-            # Create paragraphs for wrapping
-            row_data = []
-            for cell in cells:
-                # Handle bold inside cell
-                cell_text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', cell)
-                row_data.append(Paragraph(cell_text, styles['Normal']))
-            data.append(row_data)
+        pdf = _pdf_kit()
+        normal = styles['Normal']
+        # Rows are buffered only when they start and end with '|', so the
+        # split always has an empty first and last cell to drop.
+        # Empty rows and the |---| delimiter row are skipped.
+        data = [
+            [pdf.Paragraph(_BOLD_SUB(r'<b>\1</b>', cell), normal) for cell in cells]
+            for row_str in buffer
+            if (cells := [c.strip() for c in row_str.split('|')[1:-1]]) and '---' not in cells[0]
+        ]
         
         if not data: return
 
@@ -201,8 +331,9 @@ This report is generated by an AI-powered legal analysis system and is intended
         num_cols = len(data[0])
         col_width = available_width / num_cols if num_cols > 0 else available_width
         
-        t = Table(data, colWidths=[col_width] * num_cols)
-        t.setStyle(TableStyle([
+        colors = pdf.colors
+        t = pdf.Table(data, colWidths=[col_width] * num_cols)
+        t.setStyle(pdf.TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
@@ -215,8 +346,71 @@ This report is generated by an AI-powered legal analysis system and is intended
             ('RIGHTPADDING', (0, 0), (-1, -1), 6),
         ]))
         elements.append(t)
-        elements.append(Spacer(1, 0.2 * inch))
+        elements.append(_spacer(0.2))
 
+    def _append_markdown_flowables(self, markdown_text: str, elements: List[Any]) -> None:
+        """Parse markdown line by line into ReportLab flowables."""
+        pdf = _pdf_kit()
+        table_buffer = []
+        
+        for line in markdown_text.split('\n'):
+            line = line.strip()
+            
+            # Check for table
+            if line.startswith('|') and line.endswith('|'):
+                table_buffer.append(line)
+                continue
+            else:
+                # Flush table buffer if we hit a non-table line
+                if table_buffer:
+                    self._process_table(table_buffer, elements, pdf.styles, pdf.available_width)
+                    table_buffer = []
+            
+            if not line:
+                # Reduce blank space? User asked for less space.
+                # We can add small space
+                # elements.append(_spacer(0.1))
+                continue
+            
+            # Ignore separators
+            if line == '---' or line == '___' or set(line) == {'-'}:
+                continue
+            
+            # Every handled prefix is a marker followed by one space, so the
+            # text up to the first space is the dispatch key
+            prefix = line[:line.find(' ') + 1]
+            handler = _LINE_HANDLERS.get(prefix)
+            if handler is not None:
+                handler(line[len(prefix):], elements)
+            else:
+                _add_paragraph(line, elements)
+        
+        # Final flush
+        if table_buffer:
+            self._process_table(table_buffer, elements, pdf.styles, pdf.available_width)
+    
+    def _build_pdf(self, case_id: str, elements: List[Any]) -> str:
+        """Lay out flowables into the case's PDF report file."""
+        case_dir = self.documents_dir / case_id
+        case_dir.mkdir(parents=True, exist_ok=True)
+        
+        pdf_path = case_dir / "case_analysis_report.pdf"
+        pdf = _pdf_kit()
+        
+        # Page settings
+        doc = pdf.SimpleDocTemplate(
+            str(pdf_path),
+            pagesize=pdf.pagesize,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72
+        )
+        
+        doc.build(elements)
+        logger.info(f"PDF report generated: {pdf_path}")
+        return str(pdf_path)
+    
     def generate_pdf_report(
         self,
         case_id: str,
@@ -226,134 +420,128 @@ This report is generated by an AI-powered legal analysis system and is intended
         Generate PDF report from markdown using reportlab.
         """
         try:
-            case_dir = self.documents_dir / case_id
-            case_dir.mkdir(parents=True, exist_ok=True)
-            
-            pdf_path = case_dir / "case_analysis_report.pdf"
-            
-            # Page settings
-            doc = SimpleDocTemplate(
-                str(pdf_path),
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
-            # Calculate available width for tables
-            available_width = A4[0] - 144 # 72*2
+            elements = []
+            self._append_markdown_flowables(markdown_text, elements)
+            return self._build_pdf(case_id, elements)
             
+        except Exception as e:
+            logger.error(f"Error generating PDF: {str(e)}")
+            raise
+    
+    def _write_markdown_file(self, markdown_path: Path, blocks: List[Tuple[str, Any]]) -> None:
+        """Write report blocks to a markdown file."""
+        with open(markdown_path, 'w', encoding='utf-8') as f:
+            for block in blocks:
+                self._write_markdown_block(block, f)
+    
+    def _render_pdf(self, case_id: str, blocks: List[Tuple[str, Any]]) -> str:
+        """Turn report blocks into flowables and build the PDF."""
+        try:
             elements = []
-            styles = getSampleStyleSheet()
-            styles['Normal'].alignment = TA_JUSTIFY
+            for block in blocks:
+                self._append_block_flowables(block, elements)
+            return self._build_pdf(case_id, elements)
             
-            # Custom Styles
-            styles.add(ParagraphStyle(name='Justify', alignment=TA_JUSTIFY, parent=styles['Normal']))
+        except Exception as e:
+            logger.error(f"Error generating PDF: {str(e)}")
+            raise
+    
+    def _report_result(
+        self,
+        case_id: str,
+        case_dir: Path,
+        pdf_path: str,
+        markdown_path: Optional[Path]
+    ) -> Dict[str, Any]:
+        """Build the generate_report response for a finished report."""
+        return {
+            "case_id": case_id,
+            "pdf_path": pdf_path,
+            "markdown_path": str(markdown_path) if markdown_path else None,
+            "case_directory": str(case_dir),
+            "generated_at": datetime.now().isoformat(),
+            "report_size_kb": round(Path(pdf_path).stat().st_size / 1024, 2)
+        }
+    
+    def generate_report(
+        self,
+        case_id: str,
+        case_data: Dict[str, Any],
+        save_markdown: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Generate complete case analysis report.
+        
+        The report blocks are produced once and streamed to the markdown
+        file and the PDF flowable list together, so the full markdown text
+        is never built in memory or re-parsed for the PDF.
+        """
+        try:
+            logger.info(f"Generating report for case: {case_id}")
             
-            lines = markdown_text.split('\n')
-            table_buffer = []
+            case_dir = self.documents_dir / case_id
+            case_dir.mkdir(parents=True, exist_ok=True)
             
-            for line in lines:
-                line = line.strip()
-                
-                # Check for table
-                if line.startswith('|') and line.endswith('|'):
-                    table_buffer.append(line)
-                    continue
-                else:
-                    # Flush table buffer if we hit a non-table line
-                    if table_buffer:
-                        self._process_table(table_buffer, elements, styles, available_width)
-                        table_buffer = []
-                
-                if not line:
-                    # Reduce blank space? User asked for less space.
-                    # We can add small space
-                    # elements.append(Spacer(1, 0.1*inch))
-                    continue
-                
-                # Ignore separators
-                if line == '---' or line == '___' or set(line) == {'-'}:
-                    continue
-                
-                # HEADINGS
-                if line.startswith('# '):
-                    text = line[2:].strip()
-                    elements.append(Spacer(1, 0.2*inch))
-                    elements.append(Paragraph(text, styles['Title']))
-                    elements.append(Spacer(1, 0.2*inch))
-                elif line.startswith('## '):
-                    text = line[3:].strip()
-                    elements.append(Spacer(1, 0.2*inch))
-                    elements.append(Paragraph(text, styles['Heading2'])) # Heading1 is huge
-                    elements.append(Spacer(1, 0.1*inch))
-                elif line.startswith('### '):
-                    text = line[4:].strip()
-                    elements.append(Spacer(1, 0.1*inch))
-                    elements.append(Paragraph(text, styles['Heading3']))
-                    elements.append(Spacer(1, 0.05*inch))
-                elif line.startswith('**') and line.endswith('**'):
-                    # Bold line
-                    text = f"<b>{line[2:-2]}</b>"
-                    elements.append(Paragraph(text, styles['Normal']))
-                    elements.append(Spacer(1, 0.1*inch))
-                elif line.startswith('- ') or line.startswith('* '):
-                    # List item
-                    text = f"• {line[2:]}"
-                    # Handle bold inside list
-                    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
-                    elements.append(Paragraph(text, styles['Normal'], bulletText='•'))
-                else:
-                    # Normal paragraph
-                    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', line)
-                    elements.append(Paragraph(text, styles['Normal']))
-                    # Small space after paragraph
-                    elements.append(Spacer(1, 0.1*inch))
+            markdown_path = case_dir / "case_analysis_report.md" if save_markdown else None
+            elements = []
             
-            # Final flush
-            if table_buffer:
-                self._process_table(table_buffer, elements, styles, available_width)
+            with open(markdown_path, 'w', encoding='utf-8') if markdown_path else nullcontext() as md_file:
+                for block in self._iter_report_sections(case_id, case_data):
+                    if md_file is not None:
+                        self._write_markdown_block(block, md_file)
+                    self._append_block_flowables(block, elements)
             
-            doc.build(elements)
-            logger.info(f"PDF report generated: {pdf_path}")
-            return str(pdf_path)
+            try:
+                pdf_path = self._build_pdf(case_id, elements)
+            except Exception as e:
+                logger.error(f"Error generating PDF: {str(e)}")
+                raise
             
+            return self._report_result(case_id, case_dir, pdf_path, markdown_path)
         except Exception as e:
-            logger.error(f"Error generating PDF: {str(e)}")
-            raise
+            logger.error(f"Report generation error: {str(e)}")
+            return {"case_id": case_id, "error": str(e), "generated_at": datetime.now().isoformat()}
     
-    def generate_report(
+    async def generate_report_async(
         self,
         case_id: str,
         case_data: Dict[str, Any],
         save_markdown: bool = True
     ) -> Dict[str, Any]:
-        """Generate complete case analysis report."""
+        """
+        Generate complete case analysis report without blocking the event loop.
+        
+        The markdown write and the PDF build run concurrently in worker
+        threads, so the wall time is roughly the slower of the two.
+        
+        Args:
+            case_id: Case identifier
+            case_data: Case analysis results
+            save_markdown: Whether to also save the markdown report
+            
+        Returns:
+            Same result dictionary as generate_report
+        """
         try:
             logger.info(f"Generating report for case: {case_id}")
-            markdown_text = self.generate_markdown_report(case_id, case_data)
             
             case_dir = self.documents_dir / case_id
             case_dir.mkdir(parents=True, exist_ok=True)
             
-            markdown_path = None
-            if save_markdown:
-                markdown_path = case_dir / "case_analysis_report.md"
-                with open(markdown_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_text)
+            markdown_path = case_dir / "case_analysis_report.md" if save_markdown else None
+            blocks = list(self._iter_report_sections(case_id, case_data))
             
-            pdf_path = self.generate_pdf_report(case_id, markdown_text)
+            loop = asyncio.get_running_loop()
+            pdf_build = loop.run_in_executor(None, self._render_pdf, case_id, blocks)
+            if markdown_path:
+                _, pdf_path = await asyncio.gather(
+                    loop.run_in_executor(None, self._write_markdown_file, markdown_path, blocks),
+                    pdf_build
+                )
+            else:
+                pdf_path = await pdf_build
             
-            result = {
-                "case_id": case_id,
-                "pdf_path": pdf_path,
-                "markdown_path": str(markdown_path) if markdown_path else None,
-                "case_directory": str(case_dir),
-                "generated_at": datetime.now().isoformat(),
-                "report_size_kb": round(Path(pdf_path).stat().st_size / 1024, 2)
-            }
-            return result
+            return self._report_result(case_id, case_dir, pdf_path, markdown_path)
         except Exception as e:
             logger.error(f"Report generation error: {str(e)}")
             return {"case_id": case_id, "error": str(e), "generated_at": datetime.now().isoformat()}
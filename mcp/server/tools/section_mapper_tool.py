@@ -8,19 +8,166 @@ Maps legal issues to relevant sections of:
 - CrPC (Code of Criminal Procedure)
 """
 
-import json
+import re
+import sys
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from pathlib import Path
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
+
+# orjson parses sections.json much faster; json.loads also accepts bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON, as orjson.dumps produces."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Words indexed for search_sections
+_TOKEN_RE = re.compile(r"\w+")
+
+# Separates fields and rows in the concatenated search text
+_FIELD_SEP = "\x00"
+
+# Most edits for an issue to count as a misspelling of a key; short
+# issues get one edit per three characters
+_MAX_TYPO_DISTANCE = 2
+
+# partial_ratio score of a key containing the issue or contained in it;
+# anything lower attaches unrelated statutes (e.g. "Rent" -> Arrest)
+_CONTAINMENT_SCORE = 100
+
+# Attributes derived from a sections file, shared by mappers loading it
+_LOADED_FIELDS = (
+    "sections_data", "_act_issues", "_act_notes", "_rows", "_by_act_secnum", "_titles_lc",
+    "_descs_lc", "_sec_nums", "_row_charsets", "_search_text", "_row_starts", "_postings",
+    "_terms", "_suffixes", "_suffix_terms", "_number_postings", "_issue_lc_to_key", "_lower_keys", "_row_json", "_row_ids"
+)
+
+# (path, mtime_ns, size) -> loaded state; a changed file gets a new key
+_LOAD_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+@dataclass
+class SectionRow:
+    """A section of the flattened store, with the act and issue it is listed under."""
+
+    act: str
+    issue: str
+    section: Any
+    title: str
+    description: str
+    raw: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Section fields tagged with act and issue, as returned by the mapper."""
+        return {"act": self.act, "issue": self.issue, **self.raw}
+
+
+class _MappedSection:
+    """
+    A mapped section kept for serialization: the section dict tagged with
+    act, issue and type. Shares the section dict instead of copying it;
+    map_sections returns the merged dicts built by to_dict().
+    """
+    
+    __slots__ = ("act", "issue", "type", "section")
+    TAGS = ("act", "issue", "type")
+    
+    def __init__(self, act: str, issue: str, type: str, section: Dict[str, Any]):
+        self.act = act
+        self.issue = issue
+        self.type = type
+        self.section = section
+    
+    def tag(self, name: str) -> Any:
+        """Tag value as merged; a section's own field of the same name wins."""
+        return self.section[name] if name in self.section else getattr(self, name)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Merged dict {"act", "issue", "type", **section}."""
+        return {"act": self.act, "issue": self.issue, "type": self.type, **self.section}
+
+
+def _intersect_sorted(small: List[int], large: List[int]) -> List[int]:
+    """
+    Intersect two ascending id lists by galloping through the larger one.
+    
+    Args:
+        small: Shorter ascending list
+        large: Longer ascending list
+        
+    Returns:
+        Ascending ids present in both
+    """
+    result = []
+    lo, n = 0, len(large)
+    for x in small:
+        # Double the step until it passes x, then binary search that bracket
+        bound = 1
+        while lo + bound < n and large[lo + bound] < x:
+            bound *= 2
+        lo = bisect_left(large, x, lo, min(lo + bound + 1, n))
+        if lo == n:
+            break
+        if large[lo] == x:
+            result.append(x)
+            lo += 1
+    return result
+
+
+def _intern_keys(sections_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern the act and issue names used as keys of the sections data.
+    
+    The rows and indexes built from the data then share one string object
+    per name, and comparisons against them short-circuit on identity.
+    """
+    return {
+        sys.intern(act): (
+            {sys.intern(issue): sections for issue, sections in act_data.items()}
+            if isinstance(act_data, dict) else act_data
+        )
+        for act, act_data in sections_data.items()
+    }
+
+
+def _charset_mask(text: str) -> int:
+    """
+    Bitmap of the characters in text: bit n for code point n, with every
+    code point from 255 up sharing bit 255.
+    """
+    mask = 0
+    for c in set(text):
+        mask |= 1 << min(ord(c), 255)
+    return mask
+
+
+def _section_matches(section: Dict[str, Any], query_lower: str) -> bool:
+    """Whether a lowercase query occurs in a section's title, description or number."""
+    return (query_lower in section.get("title", "").lower() or
+            query_lower in section.get("description", "").lower() or
+            query_lower in section.get("section", ""))
+
 
 class SectionMapper:
     """Maps legal issues to relevant legal sections."""
     
+    DEFAULT_ACTS = ("IPC", "BNS", "IT_ACT", "CrPC")
+    
     def __init__(self, sections_file: Optional[str] = None):
         """
         Initialize the SectionMapper.
@@ -34,23 +181,227 @@ class SectionMapper:
         
         self.sections_file = Path(sections_file)
         self.sections_data = {}
+        
+        # Issue -> sections of each act without the "note" entry, and the
+        # notes on their own
+        self._act_issues: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._act_notes: Dict[str, Any] = {}
+        
+        # Flat row store of every section, with ids by (act, section number)
+        self._rows: List[SectionRow] = []
+        self._by_act_secnum: Dict[Tuple[str, Any], int] = {}
+        
+        # Each row's section serialized without the act/issue/type tags,
+        # and row ids by id() of the section dict (kept alive by _rows)
+        self._row_json: List[bytes] = []
+        self._row_ids: Dict[int, int] = {}
+        
+        # Search index: parallel columns of the searched fields (title and
+        # description pre-lowercased), and token/section number -> ascending
+        # row ids
+        self._titles_lc: List[str] = []
+        self._descs_lc: List[str] = []
+        self._sec_nums: List[str] = []
+        # Characters present in each row's searched fields, see _charset_mask
+        self._row_charsets: List[int] = []
+        # The same fields of all rows as one string, and each row's offset
+        self._search_text = ""
+        self._row_starts: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        # Indexed words sorted for prefix lookups, and every suffix of every
+        # word sorted (with the word it belongs to) for infix lookups
+        self._terms: List[str] = []
+        self._suffixes: List[str] = []
+        self._suffix_terms: List[str] = []
+        self._number_postings: Dict[str, List[int]] = {}
+        
+        # Lowercase issue keys of each act for fuzzy matching, and
+        # lowercase -> original key for case-insensitive lookups
+        self._lower_keys: Dict[str, List[str]] = {}
+        self._issue_lc_to_key: Dict[str, Dict[str, str]] = {}
+        
+        # Issue lookups are pure given the loaded data; cleared on reload
+        self._sections_for_issue_cached = lru_cache(maxsize=4096)(self._sections_for_issue)
+        
         self.load_sections()
     
     def load_sections(self):
-        """Load sections from JSON file."""
+        """
+        Load sections from JSON file.
+        
+        The parsed data and indexes are cached per file path, modification
+        time and size, so further mappers over an unchanged file reuse them.
+        """
         try:
             if not self.sections_file.exists():
-                logger.error(f"Sections file not found: {self.sections_file}")
+                logger.error("Sections file not found: %s", self.sections_file)
                 return
             
-            with open(self.sections_file, 'r', encoding='utf-8') as f:
-                self.sections_data = json.load(f)
-            
-            logger.info(f"Loaded sections from {self.sections_file}")
-            logger.info(f"Available acts: {list(self.sections_data.keys())}")
+            stat = self.sections_file.stat()
+            cache_key = (str(self.sections_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            cached = _LOAD_CACHE.get(cache_key)
+            if cached is not None:
+                for name, value in cached.items():
+                    setattr(self, name, value)
+                logger.info("Reusing loaded sections from %s", self.sections_file)
+            else:
+                self.sections_data = _intern_keys(_json_loads(self.sections_file.read_bytes()))
+                
+                logger.info("Loaded sections from %s", self.sections_file)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Available acts: %s", list(self.sections_data.keys()))
+                
+                self._build_search_index()
+                self._issue_lc_to_key = {
+                    act: {key.lower(): key for key in issues}
+                    for act, issues in self._act_issues.items()
+                }
+                self._lower_keys = {act: list(keys) for act, keys in self._issue_lc_to_key.items()}
+                _LOAD_CACHE[cache_key] = {name: getattr(self, name) for name in _LOADED_FIELDS}
             
         except Exception as e:
-            logger.error(f"Error loading sections: {str(e)}")
+            logger.error("Error loading sections: %s", e)
+        
+        self._sections_for_issue_cached.cache_clear()
+    
+    def _build_search_index(self):
+        """Flatten the sections into rows and index the words of their title and description."""
+        act_issues: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        act_notes: Dict[str, Any] = {}
+        rows = []
+        by_act_secnum: Dict[Tuple[str, Any], int] = {}
+        titles_lc, descs_lc, sec_nums = [], [], []
+        postings: Dict[str, List[int]] = {}
+        number_postings: Dict[str, List[int]] = {}
+        
+        for act, act_data in self.sections_data.items():
+            if not isinstance(act_data, dict):
+                continue
+            issues = act_issues[act] = {}
+            if "note" in act_data:
+                act_notes[act] = act_data["note"]
+            for issue, sections in act_data.items():
+                if issue == "note" or not isinstance(sections, list):
+                    continue
+                issues[issue] = sections
+                for section in sections:
+                    row_id = len(rows)
+                    rows.append(SectionRow(
+                        act=act,
+                        issue=issue,
+                        section=section.get("section"),
+                        title=section.get("title") or "",
+                        description=section.get("description") or "",
+                        raw=section
+                    ))
+                    # First listing wins, as in a nested scan
+                    by_act_secnum.setdefault((act, rows[-1].section), row_id)
+                    
+                    titles_lc.append(rows[-1].title.lower())
+                    descs_lc.append(rows[-1].description.lower())
+                    sec_nums.append(str(section.get("section", "")))
+                    
+                    for token in set(_TOKEN_RE.findall(f"{titles_lc[-1]} {descs_lc[-1]}")):
+                        postings.setdefault(token, []).append(row_id)
+                    number_postings.setdefault(sec_nums[-1], []).append(row_id)
+        
+        self._act_issues = act_issues
+        self._act_notes = act_notes
+        self._rows = rows
+        self._by_act_secnum = by_act_secnum
+        self._row_json = [
+            _json_dumps({k: v for k, v in row.raw.items() if k not in _MappedSection.TAGS})
+            for row in rows
+        ]
+        self._row_ids = {id(row.raw): row_id for row_id, row in enumerate(rows)}
+        self._titles_lc = titles_lc
+        self._descs_lc = descs_lc
+        self._sec_nums = sec_nums
+        # Section numbers are matched as-is, and case-sensitively by smart case
+        self._row_charsets = [
+            _charset_mask(f"{title}{desc}{number}{number.lower()}")
+            for title, desc, number in zip(titles_lc, descs_lc, sec_nums)
+        ]
+        self._row_starts = []
+        offset = 0
+        for fields in zip(titles_lc, descs_lc, sec_nums):
+            self._row_starts.append(offset)
+            offset += sum(map(len, fields)) + len(fields)
+        self._search_text = "".join(
+            f"{title}{_FIELD_SEP}{desc}{_FIELD_SEP}{number}{_FIELD_SEP}"
+            for title, desc, number in zip(titles_lc, descs_lc, sec_nums)
+        )
+        self._postings = postings
+        self._terms = sorted(postings)
+        suffixes = sorted((term[i:], term) for term in postings for i in range(len(term)))
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_terms = [term for _, term in suffixes]
+        self._number_postings = number_postings
+        logger.info("Indexed %d sections (%d terms)", len(rows), len(postings))
+    
+    def _token_postings(self, token: str, starts_word: bool, ends_word: bool) -> List[int]:
+        """
+        Ascending ids of sections with an indexed word that can hold token.
+        
+        A query word with non-word characters on both sides must be a whole
+        indexed word and is looked up directly. One that starts a word is a
+        prefix, found by bisecting the sorted words. Any other may sit inside
+        a word and is found by bisecting the sorted word suffixes.
+        """
+        if starts_word and ends_word:
+            return self._postings.get(token, [])
+        
+        if starts_word:
+            keys, terms = self._terms, self._terms
+        else:
+            keys, terms = self._suffixes, self._suffix_terms
+        
+        ids = set()
+        for i in range(bisect_left(keys, token), len(keys)):
+            if not keys[i].startswith(token):
+                break
+            ids.update(self._postings[terms[i]])
+        return sorted(ids)
+    
+    def _candidate_ids(self, query_lower: str, number_query: Optional[str] = None) -> Iterable[int]:
+        """
+        Ids of sections that may contain the query, in ascending order.
+        
+        A substring made of word characters lies inside a single indexed
+        word, so each query word must be contained in some word of a match;
+        where the query puts non-word characters around it, it must also
+        start or end that word. Sections that pass this filter are verified
+        with the exact check.
+        Section numbers are matched against number_query (default the
+        lowercase query) since they are not lowercased.
+        """
+        if number_query is None:
+            number_query = query_lower
+        
+        # Each word with whether the query bounds it on the left and right
+        tokens = {
+            (m.group(), m.start() > 0, m.end() < len(query_lower))
+            for m in _TOKEN_RE.finditer(query_lower)
+        }
+        if not tokens:
+            # Nothing to look up (punctuation or whitespace only)
+            return range(len(self._rows))
+        
+        token_postings = sorted((self._token_postings(*t) for t in tokens), key=len)
+        text_ids = token_postings[0]
+        for ids in token_postings[1:]:
+            if not text_ids:
+                break
+            text_ids = _intersect_sorted(text_ids, ids)
+        
+        number_ids = [
+            section_id
+            for number, ids in self._number_postings.items() if number_query in number
+            for section_id in ids
+        ]
+        if not number_ids:
+            return text_ids
+        return sorted(set(text_ids).union(number_ids))
     
     def get_sections_for_issue(
         self, 
@@ -68,31 +419,59 @@ class SectionMapper:
             Dict with sections from each act
         """
         if acts is None:
-            acts = ["IPC", "BNS", "IT_ACT", "CrPC"]
+            acts = self.DEFAULT_ACTS
         
+        # Copy so callers cannot alter the memoized result
+        return dict(self._sections_for_issue_cached(issue, tuple(acts)))
+    
+    def _sections_for_issue(
+        self,
+        issue: str,
+        acts: Tuple[str, ...]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Look up the sections for an issue (memoized by get_sections_for_issue)."""
         result = {}
+        issue_lower = issue.lower()
         
         for act in acts:
-            if act not in self.sections_data:
+            issues = self._act_issues.get(act)
+            if issues is None:
                 continue
             
-            act_data = self.sections_data[act]
-            
-            # Handle note field
-            if isinstance(act_data, dict) and "note" in act_data:
-                result[f"{act}_note"] = act_data["note"]
-                # Remove note from search
-                act_data = {k: v for k, v in act_data.items() if k != "note"}
+            # Handle note field (never matched as an issue)
+            if act in self._act_notes:
+                result[f"{act}_note"] = self._act_notes[act]
             
             # Search for issue
-            if issue in act_data:
-                result[act] = act_data[issue]
-            else:
-                # Try fuzzy matching
-                for key in act_data.keys():
-                    if issue.lower() in key.lower() or key.lower() in issue.lower():
-                        result[act] = act_data[key]
-                        break
+            sections = issues.get(issue)
+            if sections is None:
+                # Same key in another case, e.g. "assault" for "Assault"
+                key = self._issue_lc_to_key[act].get(issue_lower)
+                if key is not None:
+                    sections = issues[key]
+            if sections is None:
+                # A key containing the issue (or contained in it) first, then
+                # the closest key within a few edits (typos); weaker partial
+                # matches attach unrelated statutes, so they count as misses
+                lower_keys = self._lower_keys.get(act, ())
+                max_distance = min(_MAX_TYPO_DISTANCE, len(issue_lower) // 3)
+                best = process.extractOne(
+                    issue_lower,
+                    lower_keys,
+                    scorer=fuzz.partial_ratio,
+                    score_cutoff=_CONTAINMENT_SCORE
+                )
+                if best is None and max_distance:
+                    best = process.extractOne(
+                        issue_lower,
+                        lower_keys,
+                        scorer=Levenshtein.distance,
+                        score_cutoff=max_distance
+                    )
+                if best is not None:
+                    sections = issues[self._issue_lc_to_key[act][best[0]]]
+            if sections is not None:
+                result[act] = sections
         
         return result
     
@@ -113,8 +492,19 @@ class SectionMapper:
         Returns:
             Dict with mapped sections
         """
+        result = self._map_records(domain, primary_issue, secondary_issues)
+        result["all_sections"] = [record.to_dict() for record in result["all_sections"]]
+        return result
+    
+    def _map_records(
+        self,
+        domain: str,
+        primary_issue: str,
+        secondary_issues: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build the map_sections result with all_sections as _MappedSection records."""
         try:
-            logger.info(f"Mapping sections for: Domain={domain}, Issue={primary_issue}")
+            logger.info("Mapping sections for: Domain=%s, Issue=%s", domain, primary_issue)
             
             result = {
                 "domain": domain,
@@ -126,11 +516,17 @@ class SectionMapper:
             
             # Determine which acts to use based on domain
             if domain == "Cyber":
-                acts = ["IT_ACT", "IPC", "BNS"]
+                acts = ("IT_ACT", "IPC", "BNS")
             elif domain in ["Criminal", "Family"]:
-                acts = ["IPC", "BNS", "CrPC"]
+                acts = ("IPC", "BNS", "CrPC")
             else:
-                acts = ["IPC", "BNS"]
+                acts = ("IPC", "BNS")
+            
+            # Summary counts, kept while sections are collected
+            all_sections = result["all_sections"]
+            primary_count = 0
+            secondary_count = 0
+            acts_covered = set()
             
             # Get sections for primary issue
             primary_sections = self.get_sections_for_issue(primary_issue, acts)
@@ -140,12 +536,14 @@ class SectionMapper:
             for act, sections in primary_sections.items():
                 if not act.endswith("_note") and isinstance(sections, list):
                     for section in sections:
-                        result["all_sections"].append({
-                            "act": act,
-                            "issue": primary_issue,
-                            "type": "primary",
-                            **section
-                        })
+                        record = _MappedSection(act, primary_issue, "primary", section)
+                        all_sections.append(record)
+                        acts_covered.add(record.tag("act"))
+                        # A section's own "type" (e.g. CrPC "Procedural") overrides ours
+                        if record.tag("type") == "primary":
+                            primary_count += 1
+                        elif record.tag("type") == "secondary":
+                            secondary_count += 1
             
             # Get sections for secondary issues
             if secondary_issues:
@@ -157,27 +555,28 @@ class SectionMapper:
                     for act, sections in sec_sections.items():
                         if not act.endswith("_note") and isinstance(sections, list):
                             for section in sections:
-                                result["all_sections"].append({
-                                    "act": act,
-                                    "issue": sec_issue,
-                                    "type": "secondary",
-                                    **section
-                                })
+                                record = _MappedSection(act, sec_issue, "secondary", section)
+                                all_sections.append(record)
+                                acts_covered.add(record.tag("act"))
+                                if record.tag("type") == "primary":
+                                    primary_count += 1
+                                elif record.tag("type") == "secondary":
+                                    secondary_count += 1
             
             # Summary
             result["summary"] = {
-                "total_sections": len(result["all_sections"]),
-                "acts_covered": list(set([s["act"] for s in result["all_sections"]])),
-                "primary_sections_count": len([s for s in result["all_sections"] if s["type"] == "primary"]),
-                "secondary_sections_count": len([s for s in result["all_sections"] if s["type"] == "secondary"])
+                "total_sections": len(all_sections),
+                "acts_covered": sorted(acts_covered),
+                "primary_sections_count": primary_count,
+                "secondary_sections_count": secondary_count
             }
             
-            logger.info(f"Mapped {len(result['all_sections'])} sections")
+            logger.info("Mapped %d sections", len(all_sections))
             
             return result
             
         except Exception as e:
-            logger.error(f"Section mapping error: {str(e)}")
+            logger.error("Section mapping error: %s", e)
             return {
                 "domain": domain,
                 "primary_issue": primary_issue,
@@ -185,6 +584,52 @@ class SectionMapper:
                 "all_sections": []
             }
     
+    def map_sections_bytes(
+        self,
+        domain: str,
+        primary_issue: str,
+        secondary_issues: Optional[List[str]] = None
+    ) -> bytes:
+        """
+        Map legal issues to sections, serialized as compact JSON.
+        
+        Same document as map_sections; the all_sections records are
+        assembled from section JSON serialized once at load.
+        
+        Args:
+            domain: Legal domain (Criminal, Civil, etc.)
+            primary_issue: Primary legal issue
+            secondary_issues: List of secondary issues
+            
+        Returns:
+            UTF-8 JSON bytes
+        """
+        result = self._map_records(domain, primary_issue, secondary_issues)
+        
+        parts = []
+        for key, value in result.items():
+            if key == "all_sections":
+                encoded = b"[" + b",".join(map(self._record_json, value)) + b"]"
+            else:
+                encoded = _json_dumps(value)
+            parts.append(_json_dumps(key) + b":" + encoded)
+        return b"{" + b",".join(parts) + b"}"
+    
+    def _record_json(self, record: _MappedSection) -> bytes:
+        """JSON of a mapped section from its row's pre-serialized fields."""
+        row_id = self._row_ids.get(id(record.section))
+        if row_id is None:
+            return _json_dumps(record.to_dict())
+        
+        tags = b",".join(
+            b'"' + name.encode() + b'":' + _json_dumps(record.tag(name))
+            for name in _MappedSection.TAGS
+        )
+        body = self._row_json[row_id]
+        if body == b"{}":
+            return b"{" + tags + b"}"
+        return b"{" + tags + b"," + body[1:]
+    
     def get_section_details(self, act: str, section_number: str) -> Optional[Dict[str, Any]]:
         """
         Get details of a specific section.
@@ -197,41 +642,112 @@ class SectionMapper:
             Section details or None
         """
         try:
-            if act not in self.sections_data:
+            row_id = self._by_act_secnum.get((act, section_number))
+            if row_id is None:
                 return None
-            
-            act_data = self.sections_data[act]
-            
-            # Search through all issues
-            for issue, sections in act_data.items():
-                if issue == "note":
-                    continue
-                
-                if isinstance(sections, list):
-                    for section in sections:
-                        if section.get("section") == section_number:
-                            return {
-                                "act": act,
-                                "issue": issue,
-                                **section
-                            }
-            
-            return None
+            return self._rows[row_id].to_dict()
             
         except Exception as e:
-            logger.error(f"Error getting section details: {str(e)}")
+            logger.error("Error getting section details: %s", e)
             return None
     
-    def search_sections(self, query: str) -> List[Dict[str, Any]]:
+    def search_sections(
+        self,
+        query: str,
+        fallback: bool = False,
+        smart_case: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Search sections by keyword.
         
+        Candidates come from the inverted word index, are skipped unless
+        they contain every character of the query, and are then checked
+        against the pre-lowercased field columns with the same substring
+        match as a full scan, so results are identical.
+        
         Args:
             query: Search query
+            fallback: Scan every section instead of using the index
+            smart_case: Match case-sensitively if the query has uppercase
+                letters (as in fzf)
             
         Returns:
             List of matching sections
         """
+        if fallback:
+            return self._scan_sections(query)
+        
+        query_lower = query.lower()
+        # A case-sensitive title/description match is also a case-insensitive
+        # one, so the lowercase index and charsets still find every candidate
+        case_sensitive = smart_case and query != query_lower
+        query_mask = _charset_mask(query_lower)
+        charsets, rows = self._row_charsets, self._rows
+        titles, descs, numbers = self._titles_lc, self._descs_lc, self._sec_nums
+        
+        try:
+            results = []
+            for i in self._candidate_ids(query_lower, query if case_sensitive else None):
+                if charsets[i] & query_mask != query_mask:
+                    continue
+                if case_sensitive:
+                    row = rows[i]
+                    matched = query in row.title or query in row.description or query in numbers[i]
+                else:
+                    matched = query_lower in titles[i] or query_lower in descs[i] or query_lower in numbers[i]
+                if matched:
+                    results.append(rows[i].to_dict())
+            
+            logger.info("Found %d sections matching '%s'", len(results), query)
+            return results
+            
+        except Exception as e:
+            logger.error("Search error: %s", e)
+            return []
+    
+    def search_keywords(self, keywords: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Search sections containing any of several keywords.
+        
+        The keywords are compiled into one alternation and matched in a
+        single pass over the concatenated search text; after a hit the scan
+        resumes at the next section.
+        
+        Args:
+            keywords: Keywords to look for (case-insensitive)
+            
+        Returns:
+            List of matching sections, in file order
+        """
+        needles = {k.strip().lower() for k in keywords}
+        needles.discard("")
+        if not needles:
+            return []
+        
+        # Longest first so a keyword isn't shadowed by its own prefix
+        pattern = re.compile("|".join(map(re.escape, sorted(needles, key=len, reverse=True))))
+        text, starts = self._search_text, self._row_starts
+        
+        try:
+            results = []
+            match = pattern.search(text)
+            while match:
+                row_id = bisect_right(starts, match.start()) - 1
+                results.append(self._rows[row_id].to_dict())
+                if row_id + 1 == len(starts):
+                    break
+                match = pattern.search(text, starts[row_id + 1])
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Found %d sections matching any of %s", len(results), sorted(needles))
+            return results
+            
+        except Exception as e:
+            logger.error("Search error: %s", e)
+            return []
+    
+    def _scan_sections(self, query: str) -> List[Dict[str, Any]]:
+        """Search sections by scanning every one (reference for search_sections)."""
         results = []
         query_lower = query.lower()
         
@@ -245,28 +761,45 @@ class SectionMapper:
                         if isinstance(sections, list):
                             for section in sections:
                                 # Search in title, description, section number
-                                if (query_lower in section.get("title", "").lower() or
-                                    query_lower in section.get("description", "").lower() or
-                                    query_lower in section.get("section", "")):
+                                if _section_matches(section, query_lower):
                                     results.append({
                                         "act": act,
                                         "issue": issue,
                                         **section
                                     })
             
-            logger.info(f"Found {len(results)} sections matching '{query}'")
+            logger.info("Found %d sections matching '%s'", len(results), query)
             return results
             
         except Exception as e:
-            logger.error(f"Search error: {str(e)}")
+            logger.error("Search error: %s", e)
             return []
 
 
-# Global instance
-section_mapper = SectionMapper()
+# Global instance, created on first use so importing doesn't load the sections
+_section_mapper: Optional[SectionMapper] = None
+_section_mapper_lock = threading.Lock()
+
+
+def get_section_mapper() -> SectionMapper:
+    """
+    Get the process-wide SectionMapper, creating it on first call.
+    
+    Returns:
+        Shared SectionMapper instance
+    """
+    global _section_mapper
+    if _section_mapper is None:
+        with _section_mapper_lock:
+            if _section_mapper is None:
+                _section_mapper = SectionMapper()
+    return _section_mapper
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    section_mapper = get_section_mapper()
+    
     # Test the section mapper
     print("Section Mapper Test")
     print("=" * 50)